@@ -1,19 +1,90 @@
 # NOTICE - per Apache 2.0 license:
 # This file was copied and modified from the OpenAI Python client library: https://github.com/openai/openai-python
+import asyncio
+import atexit
+import hashlib
 import json
+import math
 import os
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from functools import wraps
-from typing import Any, AsyncIterable, Dict, Iterator, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    ClassVar,
+    Dict,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 import requests
-from aiohttp import ClientSession, ClientTimeout
 from llmengine.errors import parse_error
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # orjson is an optional dependency that parses JSON several times faster than the stdlib.
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as json_loads  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    # aiohttp is only imported when the asynchronous client is first used, since importing
+    # it accounts for about half of the time taken by `import llmengine`.
+    from aiohttp import ClientSession, ClientTimeout
 
 SCALE_API_KEY = os.getenv("SCALE_API_KEY")
 SPELLBOOK_API_URL = "https://api.spellbook.scale.com"
 LLM_ENGINE_BASE_PATH = os.getenv("LLM_ENGINE_BASE_PATH", SPELLBOOK_API_URL)
 DEFAULT_TIMEOUT: int = 10
 
+# Connection pooling for the synchronous client. Idempotent requests are retried on
+# transient gateway errors; POSTs are never retried since they are not idempotent.
+POOL_CONNECTIONS = 8
+POOL_MAXSIZE = 32
+RETRY_STATUS_FORCELIST = [429, 502, 503, 504]
+
+# Connection pooling for the asynchronous client. The keepalive timeout is kept longer than
+# the gateway's so that idle pooled connections are not handed out after the server closed them.
+AIO_CONNECTION_LIMIT = 32
+AIO_CONNECTION_LIMIT_PER_HOST = 16
+AIO_KEEPALIVE_TIMEOUT = 60
+MAX_CONCURRENT_REQUESTS = 16
+
+# In-process cache for GET responses that change slowly (e.g. model endpoints).
+GET_CACHE_MAXSIZE = 512
+GET_CACHE_TTL_SECONDS = 30
+
+
+def _float_from_env(name: str, default: float) -> float:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        parsed = float(value)
+    except ValueError:
+        parsed = math.nan
+    if math.isnan(parsed):
+        warnings.warn(f"Ignoring {name}={value!r}, which is not a number; using {default}.")
+        return default
+    return parsed
+
+
+# Client-side rate limiting, so that bursts of requests are spread out instead of being
+# rejected with HTTP 429 and retried. Set LLM_ENGINE_MAX_REQUESTS_PER_SECOND to 0 (or any value
+# <= 0) to disable it.
+MAX_REQUESTS_PER_SECOND = _float_from_env("LLM_ENGINE_MAX_REQUESTS_PER_SECOND", 20)
+MAX_REQUESTS_BURST = 40
+RATE_LIMITED_BACKOFF_SECONDS = 30
+
 
 def get_api_key() -> str:
     return SCALE_API_KEY or "root"
@@ -29,7 +100,246 @@ def assert_self_hosted(func):
     return inner
 
 
+class _GetCacheEntry(NamedTuple):
+    etag: Optional[str]
+    content: bytes
+    expires_at: float
+
+
+class _GetCache:
+    """
+    Thread-safe LRU cache of raw GET response bodies, keyed by (credentials, resource name) so
+    that a response is only served to requests made with the API key that fetched it.
+
+    Entries are served directly until they expire; expired entries that have an ETag are
+    revalidated with `If-None-Match` rather than refetched.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, str], _GetCacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str]) -> Optional[_GetCacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: Tuple[str, str], etag: Optional[str], content: bytes) -> None:
+        with self._lock:
+            self._entries[key] = _GetCacheEntry(etag, content, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *resource_names: str) -> None:
+        """Drops the given resources for every set of credentials."""
+        with self._lock:
+            for key in [key for key in self._entries if key[1] in resource_names]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket. Each request takes one token; tokens are refilled at `rate` per
+    second up to `capacity`. When the server still answers with HTTP 429, the rate is halved
+    for a while.
+    """
+
+    __slots__ = ("rate", "capacity", "tokens", "last", "_base_rate", "_restore_at", "_lock")
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self._base_rate = rate
+        self._restore_at = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes a token and returns how many seconds the caller must wait before using it."""
+        if self._base_rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            if self._restore_at and now >= self._restore_at:
+                self.rate = self._base_rate
+                self._restore_at = 0.0
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def backoff(self, duration: float = RATE_LIMITED_BACKOFF_SECONDS) -> None:
+        if self._base_rate <= 0:
+            return
+        with self._lock:
+            self.rate = max(self.rate / 2, self._base_rate / 64)
+            self._restore_at = time.monotonic() + duration
+
+
+def _aio_timeout(timeout: int) -> "ClientTimeout":
+    from aiohttp import ClientTimeout
+
+    return ClientTimeout(timeout)
+
+
+async def _close_aio_session(session: "ClientSession") -> None:
+    try:
+        await session.close()
+    except RuntimeError:
+        # The loop the session's connections belong to has already been closed, so they can't
+        # be shut down gracefully; the connector is still marked closed and releases them.
+        pass
+
+
+async def _close_aio_session_on_loop_shutdown(session: "ClientSession") -> None:
+    """
+    Waits until cancelled, then closes the session. `asyncio.run()` cancels the tasks that are
+    still pending before it closes the loop, so the session is closed on the loop it is bound to.
+    """
+    try:
+        await asyncio.get_running_loop().create_future()
+    except asyncio.CancelledError:
+        await _close_aio_session(session)
+        raise
+
+
+def _close_aio_session_at_exit() -> None:
+    # Covers event loops that are managed by hand and never closed, so the closer task of the
+    # shared session is still pending when the interpreter exits.
+    loop, closer = APIEngine._aio_session_loop, APIEngine._aio_session_closer
+    if loop is None or closer is None or closer.done() or loop.is_closed() or loop.is_running():
+        return
+    closer.cancel()
+    loop.run_until_complete(asyncio.wait([closer]))
+
+
 class APIEngine:
+    # requests.Session is not guaranteed to be thread-safe, so each thread gets its own
+    # session (and connection pool), shared by every APIEngine subclass.
+    _thread_local: ClassVar[threading.local] = threading.local()
+    # aiohttp sessions are bound to the event loop they were created on, so the shared
+    # session is recreated whenever it is used from a different loop.
+    _aio_session: ClassVar[Optional["ClientSession"]] = None
+    _aio_session_loop: ClassVar[Optional[asyncio.AbstractEventLoop]] = None
+    _aio_session_closer: ClassVar[Optional["asyncio.Task[None]"]] = None
+    _get_cache: ClassVar[_GetCache] = _GetCache(GET_CACHE_MAXSIZE, GET_CACHE_TTL_SECONDS)
+    _rate_limiter: ClassVar[_TokenBucket] = _TokenBucket(
+        MAX_REQUESTS_PER_SECOND, MAX_REQUESTS_BURST
+    )
+    # Concurrent GETs of the same resource share a single in-flight request.
+    _inflight: ClassVar[Dict[Tuple[str, str], "Future[bytes]"]] = {}
+    _inflight_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        session = getattr(cls._thread_local, "session", None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=POOL_CONNECTIONS,
+                pool_maxsize=POOL_MAXSIZE,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.2,
+                    status_forcelist=RETRY_STATUS_FORCELIST,
+                    raise_on_status=False,
+                ),
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update({"x-api-key": get_api_key()})
+            cls._thread_local.session = session
+        return session
+
+    @classmethod
+    def _get_aio_session(cls) -> "ClientSession":
+        from aiohttp import ClientSession, TCPConnector
+
+        loop = asyncio.get_running_loop()
+        session = APIEngine._aio_session
+        if session is None or session.closed or APIEngine._aio_session_loop is not loop:
+            cls._retire_aio_session(loop)
+            session = ClientSession(
+                connector=TCPConnector(
+                    limit=AIO_CONNECTION_LIMIT,
+                    limit_per_host=AIO_CONNECTION_LIMIT_PER_HOST,
+                    keepalive_timeout=AIO_KEEPALIVE_TIMEOUT,
+                    force_close=False,
+                    enable_cleanup_closed=True,
+                ),
+                headers={"x-api-key": get_api_key()},
+            )
+            APIEngine._aio_session = session
+            APIEngine._aio_session_loop = loop
+            APIEngine._aio_session_closer = loop.create_task(
+                _close_aio_session_on_loop_shutdown(session)
+            )
+        return session
+
+    @classmethod
+    def _retire_aio_session(cls, loop: asyncio.AbstractEventLoop) -> None:
+        """Closes the shared session that is about to be replaced."""
+        session, session_loop = APIEngine._aio_session, APIEngine._aio_session_loop
+        closer = APIEngine._aio_session_closer
+        if session is None or session_loop is None or closer is None or closer.done():
+            return
+        if session_loop is loop:
+            closer.cancel()
+        elif not session_loop.is_closed():
+            # The session's loop is still alive (e.g. running in another thread), so the session
+            # is closed there by its closer task.
+            session_loop.call_soon_threadsafe(closer.cancel)
+        else:
+            # The loop was closed without cancelling its tasks, so the closer task never ran.
+            closer._log_destroy_pending = False  # type: ignore[attr-defined]
+            loop.create_task(_close_aio_session(session))
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """
+        Closes the connection pool shared by the asynchronous methods (e.g.
+        [Model.aget()](./#llmengine.model.Model.aget) and
+        [Completion.acreate()](./#llmengine.completion.Completion.acreate)).
+
+        The pool is closed automatically when the event loop started by `asyncio.run()`
+        finishes, so this is only needed to release the connections earlier, or when the event
+        loop is managed by hand. A new pool is opened by the next asynchronous call.
+        """
+        session, closer = APIEngine._aio_session, APIEngine._aio_session_closer
+        APIEngine._aio_session = None
+        APIEngine._aio_session_loop = None
+        APIEngine._aio_session_closer = None
+        if closer is not None:
+            closer.cancel()
+        if session is not None:
+            await _close_aio_session(session)
+
+    @classmethod
+    def _error(cls, status_code: int, content: bytes) -> Exception:
+        if status_code == 429:
+            cls._rate_limiter.backoff()
+        return parse_error(status_code, content)
+
     @classmethod
     def validate_api_key(cls):
         if SPELLBOOK_API_URL == LLM_ENGINE_BASE_PATH and not SCALE_API_KEY:
@@ -38,75 +348,131 @@ class APIEngine:
             )
 
     @classmethod
-    def _get(cls, resource_name: str, timeout: int) -> Dict[str, Any]:
-        api_key = get_api_key()
-        response = requests.get(
+    def _get(cls, resource_name: str, timeout: int, use_cache: bool = False) -> Dict[str, Any]:
+        payload = json_loads(cls._get_raw(resource_name, timeout=timeout, use_cache=use_cache))
+        return payload
+
+    @classmethod
+    def _get_raw(cls, resource_name: str, timeout: int, use_cache: bool = False) -> bytes:
+        cache_key = cls._get_cache_key(resource_name)
+        entry = cls._get_cache.get(cache_key) if use_cache else None
+        if entry is not None and entry.expires_at > time.monotonic():
+            return entry.content
+
+        with APIEngine._inflight_lock:
+            future = APIEngine._inflight.get(cache_key)
+            is_leader = future is None
+            if future is None:
+                future = Future()
+                APIEngine._inflight[cache_key] = future
+        if not is_leader:
+            try:
+                return future.result(timeout=timeout)
+            except FutureTimeoutError:
+                # Raise what the caller would have seen had its own request timed out.
+                raise requests.exceptions.Timeout(
+                    f"Timed out after {timeout}s waiting for a concurrent GET {resource_name}"
+                ) from None
+
+        try:
+            content = cls._fetch_raw(cache_key, timeout, entry, use_cache)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(content)
+        finally:
+            with APIEngine._inflight_lock:
+                del APIEngine._inflight[cache_key]
+        return content
+
+    @classmethod
+    def _get_cache_key(cls, resource_name: str) -> Tuple[str, str]:
+        # Key on the API key this thread's session actually sends, hashed so that it is not kept
+        # in the cache in the clear.
+        api_key = cls._get_session().headers.get("x-api-key", "")
+        if isinstance(api_key, str):
+            api_key = api_key.encode()
+        return hashlib.sha256(api_key).hexdigest(), resource_name
+
+    @classmethod
+    def _fetch_raw(
+        cls,
+        cache_key: Tuple[str, str],
+        timeout: int,
+        entry: Optional[_GetCacheEntry],
+        use_cache: bool,
+    ) -> bytes:
+        resource_name = cache_key[1]
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+        cls._rate_limiter.acquire()
+        response = cls._get_session().get(
             os.path.join(LLM_ENGINE_BASE_PATH, resource_name),
             timeout=timeout,
-            headers={"x-api-key": api_key},
+            headers=headers,
         )
+        if response.status_code == 304 and entry is not None:
+            cls._get_cache.set(cache_key, entry.etag, entry.content)
+            return entry.content
         if response.status_code != 200:
-            raise parse_error(response.status_code, response.content)
-        payload = response.json()
-        return payload
+            raise cls._error(response.status_code, response.content)
+        if use_cache:
+            cls._get_cache.set(cache_key, response.headers.get("ETag"), response.content)
+        return response.content
 
     @classmethod
     def put(
         cls, resource_name: str, data: Optional[Dict[str, Any]], timeout: int
     ) -> Dict[str, Any]:
-        api_key = get_api_key()
-        response = requests.put(
+        cls._rate_limiter.acquire()
+        response = cls._get_session().put(
             os.path.join(LLM_ENGINE_BASE_PATH, resource_name),
             json=data,
             timeout=timeout,
-            headers={"x-api-key": api_key},
         )
         if response.status_code != 200:
-            raise parse_error(response.status_code, response.content)
-        payload = response.json()
+            raise cls._error(response.status_code, response.content)
+        payload = json_loads(response.content)
         return payload
 
     @classmethod
     def _delete(cls, resource_name: str, timeout: int) -> Dict[str, Any]:
-        api_key = get_api_key()
-        response = requests.delete(
+        cls._rate_limiter.acquire()
+        response = cls._get_session().delete(
             os.path.join(LLM_ENGINE_BASE_PATH, resource_name),
             timeout=timeout,
-            headers={"x-api-key": api_key},
         )
         if response.status_code != 200:
-            raise parse_error(response.status_code, response.content)
-        payload = response.json()
+            raise cls._error(response.status_code, response.content)
+        payload = json_loads(response.content)
         return payload
 
     @classmethod
     def post_sync(cls, resource_name: str, data: Dict[str, Any], timeout: int) -> Dict[str, Any]:
-        api_key = get_api_key()
-        response = requests.post(
+        cls._rate_limiter.acquire()
+        response = cls._get_session().post(
             os.path.join(LLM_ENGINE_BASE_PATH, resource_name),
             json=data,
             timeout=timeout,
-            headers={"x-api-key": api_key},
         )
         if response.status_code != 200:
-            raise parse_error(response.status_code, response.content)
-        payload = response.json()
+            raise cls._error(response.status_code, response.content)
+        payload = json_loads(response.content)
         return payload
 
     @classmethod
     def post_stream(
         cls, resource_name: str, data: Dict[str, Any], timeout: int
     ) -> Iterator[Dict[str, Any]]:
-        api_key = get_api_key()
-        response = requests.post(
+        cls._rate_limiter.acquire()
+        response = cls._get_session().post(
             os.path.join(LLM_ENGINE_BASE_PATH, resource_name),
             json=data,
             timeout=timeout,
-            headers={"x-api-key": api_key},
             stream=True,
         )
         if response.status_code != 200:
-            raise parse_error(response.status_code, response.content)
+            raise cls._error(response.status_code, response.content)
         for byte_payload in response.iter_lines():
             # Skip line
             if byte_payload == b"\n":
@@ -119,53 +485,80 @@ class APIEngine:
                 # Decode payload
                 payload_data = payload.lstrip("data:").rstrip("/n")
                 try:
-                    payload_json = json.loads(payload_data)
+                    payload_json = json_loads(payload_data)
                     yield payload_json
                 except json.JSONDecodeError:
                     raise ValueError(f"Invalid JSON payload: {payload_data}")
 
+    @classmethod
+    async def _aget(cls, resource_name: str, timeout: int) -> Dict[str, Any]:
+        await cls._rate_limiter.aacquire()
+        session = cls._get_aio_session()
+        async with session.get(
+            os.path.join(LLM_ENGINE_BASE_PATH, resource_name), timeout=_aio_timeout(timeout)
+        ) as resp:
+            if resp.status != 200:
+                raise cls._error(resp.status, await resp.read())
+            payload = await resp.json(loads=json_loads)
+            return payload
+
+    @classmethod
+    async def _adelete(cls, resource_name: str, timeout: int) -> Dict[str, Any]:
+        await cls._rate_limiter.aacquire()
+        session = cls._get_aio_session()
+        async with session.delete(
+            os.path.join(LLM_ENGINE_BASE_PATH, resource_name), timeout=_aio_timeout(timeout)
+        ) as resp:
+            if resp.status != 200:
+                raise cls._error(resp.status, await resp.read())
+            payload = await resp.json(loads=json_loads)
+            return payload
+
     @classmethod
     async def apost_sync(
         cls, resource_name: str, data: Dict[str, Any], timeout: int
     ) -> Dict[str, Any]:
-        api_key = get_api_key()
-        async with ClientSession(
-            timeout=ClientTimeout(timeout), headers={"x-api-key": api_key}
-        ) as session:
-            async with session.post(
-                os.path.join(LLM_ENGINE_BASE_PATH, resource_name), json=data
-            ) as resp:
-                if resp.status != 200:
-                    raise parse_error(resp.status, await resp.read())
-                payload = await resp.json()
-                return payload
+        await cls._rate_limiter.aacquire()
+        session = cls._get_aio_session()
+        async with session.post(
+            os.path.join(LLM_ENGINE_BASE_PATH, resource_name),
+            json=data,
+            timeout=_aio_timeout(timeout),
+        ) as resp:
+            if resp.status != 200:
+                raise cls._error(resp.status, await resp.read())
+            payload = await resp.json(loads=json_loads)
+            return payload
 
     @classmethod
     async def apost_stream(
         cls, resource_name: str, data: Dict[str, Any], timeout: int
     ) -> AsyncIterable[Dict[str, Any]]:
-        api_key = get_api_key()
-        async with ClientSession(
-            timeout=ClientTimeout(timeout), headers={"x-api-key": api_key}
-        ) as session:
-            async with session.post(
-                os.path.join(LLM_ENGINE_BASE_PATH, resource_name), json=data
-            ) as resp:
-                if resp.status != 200:
-                    raise parse_error(resp.status, await resp.read())
-                async for byte_payload in resp.content:
-                    # Skip line
-                    if byte_payload == b"\n":
-                        continue
-
-                    payload = byte_payload.decode("utf-8")
-
-                    # Event data
-                    if payload.startswith("data:"):
-                        # Decode payload
-                        payload_data = payload.lstrip("data:").rstrip("/n")
-                        try:
-                            response = json.loads(payload_data)
-                            yield response
-                        except json.JSONDecodeError:
-                            raise ValueError(f"Invalid JSON payload: {payload_data}")
+        await cls._rate_limiter.aacquire()
+        session = cls._get_aio_session()
+        async with session.post(
+            os.path.join(LLM_ENGINE_BASE_PATH, resource_name),
+            json=data,
+            timeout=_aio_timeout(timeout),
+        ) as resp:
+            if resp.status != 200:
+                raise cls._error(resp.status, await resp.read())
+            async for byte_payload in resp.content:
+                # Skip line
+                if byte_payload == b"\n":
+                    continue
+
+                payload = byte_payload.decode("utf-8")
+
+                # Event data
+                if payload.startswith("data:"):
+                    # Decode payload
+                    payload_data = payload.lstrip("data:").rstrip("/n")
+                    try:
+                        response = json_loads(payload_data)
+                        yield response
+                    except json.JSONDecodeError:
+                        raise ValueError(f"Invalid JSON payload: {payload_data}")
+
+
+atexit.register(_close_aio_session_at_exit)
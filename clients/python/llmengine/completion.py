@@ -44,6 +44,10 @@ class Completion(APIEngine):
         [CompletionStreamResponse](../../api/data_types/#llmengine.CompletionStreamResponse)
         with `request_id` and `outputs` fields.
 
+        Requests are sent over a connection pool that is shared by all asynchronous calls. The pool
+        is closed when the event loop started by `asyncio.run()` finishes; call
+        [Completion.aclose()](./#llmengine.completion.Completion.aclose) to close it earlier.
+
         Args:
             model (str):
                 Name of the model to use. See [Model Zoo](../../../model_zoo) for a list of Models that are supported.
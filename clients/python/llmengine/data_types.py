@@ -208,6 +208,17 @@ class ListLLMEndpointsResponse(BaseModel):
     """
 
 
+class BatchGetLLMEndpointsRequest(BaseModel):
+    """
+    Request object for getting several Models at once.
+    """
+
+    names: List[str] = Field(..., description="The names of the models.")
+    """
+    The names of the Models to get.
+    """
+
+
 class DeleteLLMEndpointResponse(BaseModel):
     """
     Response object for deleting a Model.
@@ -1,10 +1,32 @@
-from llmengine.api_engine import DEFAULT_TIMEOUT, APIEngine
+import asyncio
+from typing import List
+
+from llmengine.api_engine import DEFAULT_TIMEOUT, MAX_CONCURRENT_REQUESTS, APIEngine, json_loads
 from llmengine.data_types import (
+    BatchGetLLMEndpointsRequest,
     DeleteLLMEndpointResponse,
     GetLLMEndpointResponse,
     ListLLMEndpointsResponse,
+    ModelEndpointStatus,
 )
 
+MODEL_ENDPOINTS_PATH = "v1/llm/model-endpoints"
+MODEL_ENDPOINT_PATH = MODEL_ENDPOINTS_PATH + "/{}"
+MODEL_ENDPOINTS_BATCH_GET_PATH = MODEL_ENDPOINTS_PATH + ":batchGet"
+# Maximum number of names sent in a single batch get request.
+BATCH_GET_MAX_SIZE = 500
+# Responses with an endpoint in one of these statuses are not cached, since the status is about
+# to change and callers are likely polling for it.
+TRANSITIONAL_STATUSES = {
+    ModelEndpointStatus.UPDATE_PENDING,
+    ModelEndpointStatus.UPDATE_IN_PROGRESS,
+    ModelEndpointStatus.DELETE_IN_PROGRESS,
+}
+
+
+def _is_transitional(model_endpoint: GetLLMEndpointResponse) -> bool:
+    return model_endpoint.spec is not None and model_endpoint.spec.status in TRANSITIONAL_STATUSES
+
 
 class Model(APIEngine):
     """
@@ -19,6 +41,7 @@ class Model(APIEngine):
     def get(
         cls,
         model: str,
+        use_cache: bool = True,
     ) -> GetLLMEndpointResponse:
         """
         Get information about an LLM model.
@@ -34,6 +57,13 @@ class Model(APIEngine):
             model (`str`):
                 Name of the model
 
+            use_cache (`bool`):
+                Whether to serve the response from the in-process cache. Cached responses are
+                reused for up to 30 seconds and then revalidated with the server. Responses for
+                a model whose endpoint is being updated or deleted are never cached, but a
+                cached `READY` response can hide a change made elsewhere in the meantime, so
+                pass `use_cache=False` when polling for status changes.
+
         Returns:
             GetLLMEndpointResponse: object representing the LLM and configurations
 
@@ -61,11 +91,16 @@ class Model(APIEngine):
             }
             ```
         """
-        response = cls._get(f"v1/llm/model-endpoints/{model}", timeout=DEFAULT_TIMEOUT)
-        return GetLLMEndpointResponse.parse_obj(response)
+        resource_name = MODEL_ENDPOINT_PATH.format(model)
+        response = GetLLMEndpointResponse.parse_obj(
+            cls._get(resource_name, timeout=DEFAULT_TIMEOUT, use_cache=use_cache)
+        )
+        if use_cache and _is_transitional(response):
+            cls._get_cache.invalidate(resource_name)
+        return response
 
     @classmethod
-    def list(cls) -> ListLLMEndpointsResponse:
+    def list(cls, use_cache: bool = True) -> ListLLMEndpointsResponse:
         """
         List LLM models available to call inference on.
 
@@ -75,6 +110,12 @@ class Model(APIEngine):
         [GetLLMEndpointResponse](../../api/data_types/#llmengine.GetLLMEndpointResponse)
         objects for all models. The most important field is the model `name`.
 
+        Args:
+            use_cache (`bool`):
+                Whether to serve the response from the in-process cache. Cached responses are
+                reused for up to 30 seconds and then revalidated with the server. The response
+                is not cached while any endpoint is being updated or deleted.
+
         Returns:
             ListLLMEndpointsResponse: list of models
 
@@ -138,8 +179,50 @@ class Model(APIEngine):
             }
             ```
         """
-        response = cls._get("v1/llm/model-endpoints", timeout=DEFAULT_TIMEOUT)
-        return ListLLMEndpointsResponse.parse_obj(response)
+        content = cls._get_raw(MODEL_ENDPOINTS_PATH, timeout=DEFAULT_TIMEOUT, use_cache=use_cache)
+        response = ListLLMEndpointsResponse.parse_obj(json_loads(content))
+        if use_cache and any(_is_transitional(e) for e in response.model_endpoints):
+            cls._get_cache.invalidate(MODEL_ENDPOINTS_PATH)
+        return response
+
+    @classmethod
+    def get_batch(cls, models: List[str]) -> List[GetLLMEndpointResponse]:
+        """
+        Get information about several LLM models in a single request.
+
+        This is equivalent to calling [Model.get()](./#llmengine.model.Model.get) for each model,
+        but fetches all of them with one HTTP request (or one per 500 models), so the cost
+        of a network round trip is only paid once.
+
+        Args:
+            models (`List[str]`):
+                Names of the models
+
+        Returns:
+            List[GetLLMEndpointResponse]: objects representing the LLMs, in the same order as `models`
+
+        === "Accessing several models in python"
+            ```python
+            from llmengine import Model
+
+            responses = Model.get_batch(["llama-7b", "falcon-40b"])
+            for response in responses:
+                print(response.json())
+            ```
+        """
+        model_endpoints: List[GetLLMEndpointResponse] = []
+        for start in range(0, len(models), BATCH_GET_MAX_SIZE):
+            request = BatchGetLLMEndpointsRequest(names=models[start : start + BATCH_GET_MAX_SIZE])
+            response = cls.post_sync(
+                resource_name=MODEL_ENDPOINTS_BATCH_GET_PATH,
+                data=request.dict(),
+                timeout=DEFAULT_TIMEOUT,
+            )
+            model_endpoints.extend(
+                GetLLMEndpointResponse.parse_obj(model_endpoint)
+                for model_endpoint in response["model_endpoints"]
+            )
+        return model_endpoints
 
     @classmethod
     def delete(cls, model: str) -> DeleteLLMEndpointResponse:
@@ -174,5 +257,112 @@ class Model(APIEngine):
             }
             ```
         """
-        response = cls._delete(f"v1/llm/model-endpoints/{model}", timeout=DEFAULT_TIMEOUT)
+        response = cls._delete(MODEL_ENDPOINT_PATH.format(model), timeout=DEFAULT_TIMEOUT)
+        cls._get_cache.invalidate(MODEL_ENDPOINT_PATH.format(model), MODEL_ENDPOINTS_PATH)
+        return DeleteLLMEndpointResponse.parse_obj(response)
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """
+        Clears the in-process cache used by [Model.get()](./#llmengine.model.Model.get) and
+        [Model.list()](./#llmengine.model.Model.list).
+        """
+        cls._get_cache.clear()
+
+    @classmethod
+    async def aget(cls, model: str) -> GetLLMEndpointResponse:
+        """
+        Get information about an LLM model asynchronously (with `asyncio`).
+
+        This is the asynchronous version of [Model.get()](./#llmengine.model.Model.get).
+        Requests are sent over a connection pool that is shared by all asynchronous calls.
+
+        Args:
+            model (`str`):
+                Name of the model
+
+        Returns:
+            GetLLMEndpointResponse: object representing the LLM and configurations
+
+        === "Accessing model asynchronously in python"
+            ```python
+            import asyncio
+            from llmengine import Model
+
+            async def main():
+                response = await Model.aget("llama-7b.suffix.2023-07-18-12-00-00")
+                print(response.json())
+
+            asyncio.run(main())
+            ```
+        """
+        response = await cls._aget(MODEL_ENDPOINT_PATH.format(model), timeout=DEFAULT_TIMEOUT)
+        return GetLLMEndpointResponse.parse_obj(response)
+
+    @classmethod
+    async def aget_many(cls, models: List[str]) -> List[GetLLMEndpointResponse]:
+        """
+        Get information about several LLM models concurrently (with `asyncio`).
+
+        The requests are issued in parallel, with at most 16 in flight at any time, so the
+        total wall time is close to that of a single request rather than the sum of all of them.
+        If any request fails, the corresponding error is raised.
+
+        Args:
+            models (`List[str]`):
+                Names of the models
+
+        Returns:
+            List[GetLLMEndpointResponse]: objects representing the LLMs, in the same order as `models`
+
+        === "Accessing several models in python"
+            ```python
+            import asyncio
+            from llmengine import Model
+
+            async def main():
+                responses = await Model.aget_many(["llama-7b", "falcon-40b"])
+                for response in responses:
+                    print(response.json())
+
+            asyncio.run(main())
+            ```
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def _bounded_get(model: str) -> GetLLMEndpointResponse:
+            async with semaphore:
+                return await cls.aget(model)
+
+        return list(await asyncio.gather(*[_bounded_get(model) for model in models]))
+
+    @classmethod
+    async def alist(cls) -> ListLLMEndpointsResponse:
+        """
+        List LLM models available to call inference on asynchronously (with `asyncio`).
+
+        This is the asynchronous version of [Model.list()](./#llmengine.model.Model.list).
+
+        Returns:
+            ListLLMEndpointsResponse: list of models
+        """
+        response = await cls._aget(MODEL_ENDPOINTS_PATH, timeout=DEFAULT_TIMEOUT)
+        return ListLLMEndpointsResponse.parse_obj(response)
+
+    @classmethod
+    async def adelete(cls, model: str) -> DeleteLLMEndpointResponse:
+        """
+        Deletes an LLM model asynchronously (with `asyncio`).
+
+        This is the asynchronous version of [Model.delete()](./#llmengine.model.Model.delete).
+
+        Args:
+            model (`str`):
+                Name of the model
+
+        Returns:
+            response: whether the model was successfully deleted
+        """
+        response = await cls._adelete(MODEL_ENDPOINT_PATH.format(model), timeout=DEFAULT_TIMEOUT)
+        cls._get_cache.invalidate(MODEL_ENDPOINT_PATH.format(model), MODEL_ENDPOINTS_PATH)
         return DeleteLLMEndpointResponse.parse_obj(response)
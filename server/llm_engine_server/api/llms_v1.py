@@ -11,6 +11,7 @@ from llm_engine_server.api.dependencies import (
 )
 from llm_engine_server.common.datadog_utils import add_trace_resource_name
 from llm_engine_server.common.dtos.llms import (
+    BatchGetLLMModelEndpointsV1Request,
     CancelFineTuneJobResponse,
     CompletionStreamV1Request,
     CompletionStreamV1Response,
@@ -51,6 +52,7 @@ from llm_engine_server.domain.use_cases.llm_fine_tuning_use_cases import (
     ListFineTuneJobV1UseCase,
 )
 from llm_engine_server.domain.use_cases.llm_model_endpoint_use_cases import (
+    BatchGetLLMModelEndpointsV1UseCase,
     CompletionStreamV1UseCase,
     CompletionSyncV1UseCase,
     CreateLLMModelEndpointV1UseCase,
@@ -160,6 +162,32 @@ async def get_model_endpoint(
         ) from exc
 
 
+@llm_router_v1.post(
+    "/model-endpoints:batchGet",
+    response_model=ListLLMModelEndpointsV1Response,
+)
+async def batch_get_model_endpoints(
+    request: BatchGetLLMModelEndpointsV1Request,
+    auth: User = Depends(verify_authentication),
+    external_interfaces: ExternalInterfaces = Depends(get_external_interfaces_read_only),
+) -> ListLLMModelEndpointsV1Response:
+    """
+    Describe the LLM Model endpoints with the given names, in the same order as the names.
+    """
+    add_trace_resource_name("llm_model_endpoints_batch_get")
+    logger.info(f"POST /llm/model-endpoints:batchGet with {request} for {auth}")
+    try:
+        use_case = BatchGetLLMModelEndpointsV1UseCase(
+            llm_model_endpoint_service=external_interfaces.llm_model_endpoint_service
+        )
+        return await use_case.execute(user=auth, request=request)
+    except (ObjectNotFoundException, ObjectNotAuthorizedException) as exc:
+        raise HTTPException(
+            status_code=404,
+            detail="One or more of the specified Model Endpoints were not found.",
+        ) from exc
+
+
 @llm_router_v1.post("/completions-sync", response_model=CompletionSyncV1Response)
 async def create_completion_sync_task(
     model_endpoint_name: str,
@@ -91,6 +91,10 @@ class ListLLMModelEndpointsV1Response(BaseModel):
     model_endpoints: List[GetLLMModelEndpointV1Response]
 
 
+class BatchGetLLMModelEndpointsV1Request(BaseModel):
+    names: List[str] = Field(..., max_items=500)
+
+
 # Delete and update use the default LLMEngine endpoint APIs.
 
 
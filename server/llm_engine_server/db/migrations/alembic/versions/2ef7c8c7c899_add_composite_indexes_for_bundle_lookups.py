@@ -0,0 +1,89 @@
+"""add composite indexes for bundle lookups
+
+Revision ID: 2ef7c8c7c899
+Revises:
+Create Date: 2026-10-15 11:48:29.912180
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2ef7c8c7c899"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside a transaction, and keeps the table writable while the
+    # indexes are built.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_bundles_name_created_by",
+            "bundles",
+            ["name", "created_by", "created_at"],
+            schema="llm_engine",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_bundles_name_owner",
+            "bundles",
+            ["name", "owner", "created_at"],
+            schema="llm_engine",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_bundles_created_by_created_at",
+            "bundles",
+            ["created_by", "created_at"],
+            schema="llm_engine",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_llm_engine_bundles_name",
+            table_name="bundles",
+            schema="llm_engine",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_llm_engine_bundles_created_by",
+            table_name="bundles",
+            schema="llm_engine",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_llm_engine_bundles_created_by",
+            "bundles",
+            ["created_by"],
+            schema="llm_engine",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_llm_engine_bundles_name",
+            "bundles",
+            ["name"],
+            schema="llm_engine",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_bundles_created_by_created_at",
+            table_name="bundles",
+            schema="llm_engine",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_bundles_name_owner",
+            table_name="bundles",
+            schema="llm_engine",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_bundles_name_created_by",
+            table_name="bundles",
+            schema="llm_engine",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,57 @@
+"""bound trigger owner and created_by
+
+Revision ID: 30154983fa4b
+Revises: 6d3a19076ec5
+Create Date: 2026-10-15 11:50:39.537026
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "30154983fa4b"
+down_revision = "6d3a19076ec5"
+branch_labels = None
+depends_on = None
+
+SHORT_STRING = 24
+
+
+def upgrade():
+    # Fail with a clear message instead of a truncation error if any existing value would not
+    # fit. This runs in SQL so that it also guards migrations applied from --sql output.
+    op.execute(
+        f"""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM llm_engine.triggers
+                WHERE length(owner) > {SHORT_STRING} OR length(created_by) > {SHORT_STRING}
+            ) THEN
+                RAISE EXCEPTION 'triggers.owner or created_by is longer than {SHORT_STRING}';
+            END IF;
+        END
+        $$
+        """
+    )
+    for column in ("owner", "created_by"):
+        op.alter_column(
+            "triggers",
+            column,
+            type_=sa.String(SHORT_STRING),
+            existing_type=sa.String(),
+            existing_nullable=False,
+            schema="llm_engine",
+        )
+
+
+def downgrade():
+    for column in ("owner", "created_by"):
+        op.alter_column(
+            "triggers",
+            column,
+            type_=sa.String(),
+            existing_type=sa.String(SHORT_STRING),
+            existing_nullable=False,
+            schema="llm_engine",
+        )
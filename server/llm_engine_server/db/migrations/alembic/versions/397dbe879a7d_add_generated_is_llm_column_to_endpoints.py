@@ -0,0 +1,66 @@
+"""add generated is_llm column to endpoints
+
+Revision ID: 397dbe879a7d
+Revises: 2ef7c8c7c899
+Create Date: 2026-10-15 11:48:59.446306
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "397dbe879a7d"
+down_revision = "2ef7c8c7c899"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Adding a stored generated column rewrites the endpoints table under an exclusive lock.
+    op.add_column(
+        "endpoints",
+        sa.Column(
+            "is_llm", sa.Boolean(), sa.Computed("endpoint_metadata ? '_llm'", persisted=True)
+        ),
+        schema="llm_engine",
+    )
+    # Build the new unique index next to the old one so LLM endpoint names stay unique
+    # throughout, then swap the names.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "endpoint_name_llm_uc_new",
+            "endpoints",
+            ["name"],
+            unique=True,
+            schema="llm_engine",
+            postgresql_where=sa.text("is_llm"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "endpoint_name_llm_uc",
+            table_name="endpoints",
+            schema="llm_engine",
+            postgresql_concurrently=True,
+        )
+    op.execute("ALTER INDEX llm_engine.endpoint_name_llm_uc_new RENAME TO endpoint_name_llm_uc")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "endpoint_name_llm_uc_old",
+            "endpoints",
+            ["name"],
+            unique=True,
+            schema="llm_engine",
+            postgresql_where=sa.text("endpoint_metadata ? '_llm'"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "endpoint_name_llm_uc",
+            table_name="endpoints",
+            schema="llm_engine",
+            postgresql_concurrently=True,
+        )
+    op.execute("ALTER INDEX llm_engine.endpoint_name_llm_uc_old RENAME TO endpoint_name_llm_uc")
+    op.drop_column("endpoints", "is_llm", schema="llm_engine")
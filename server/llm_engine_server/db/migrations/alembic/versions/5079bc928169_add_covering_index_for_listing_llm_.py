@@ -0,0 +1,38 @@
+"""add covering index for listing llm endpoints
+
+Revision ID: 5079bc928169
+Revises: 5aa786370f55
+Create Date: 2026-10-15 11:49:34.604583
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5079bc928169"
+down_revision = "5aa786370f55"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_endpoint_llm_list",
+            "endpoints",
+            ["owner", sa.text("last_updated_at DESC")],
+            schema="llm_engine",
+            postgresql_include=["id", "name", "endpoint_status", "endpoint_type"],
+            postgresql_where=sa.text("is_llm"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_endpoint_llm_list",
+            table_name="endpoints",
+            schema="llm_engine",
+            postgresql_concurrently=True,
+        )
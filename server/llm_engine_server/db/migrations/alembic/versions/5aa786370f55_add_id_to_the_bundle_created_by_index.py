@@ -0,0 +1,45 @@
+"""add id to the bundle created_by index
+
+Revision ID: 5aa786370f55
+Revises: 397dbe879a7d
+Create Date: 2026-10-15 11:49:22.470204
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5aa786370f55"
+down_revision = "397dbe879a7d"
+branch_labels = None
+depends_on = None
+
+
+def _rebuild_created_by_index(columns):
+    # Build the replacement next to the current index, so created_by lookups can use one of
+    # them at all times, then swap the names.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_bundles_created_by_created_at_new",
+            "bundles",
+            columns,
+            schema="llm_engine",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_bundles_created_by_created_at",
+            table_name="bundles",
+            schema="llm_engine",
+            postgresql_concurrently=True,
+        )
+    op.execute(
+        "ALTER INDEX llm_engine.ix_bundles_created_by_created_at_new "
+        "RENAME TO ix_bundles_created_by_created_at"
+    )
+
+
+def upgrade():
+    _rebuild_created_by_index(["created_by", "created_at", "id"])
+
+
+def downgrade():
+    _rebuild_created_by_index(["created_by", "created_at"])
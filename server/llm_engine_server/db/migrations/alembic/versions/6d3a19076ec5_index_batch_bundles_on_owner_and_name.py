@@ -0,0 +1,50 @@
+"""index batch bundles on owner and name
+
+Revision ID: 6d3a19076ec5
+Revises: 5079bc928169
+Create Date: 2026-10-15 11:50:25.640163
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "6d3a19076ec5"
+down_revision = "5079bc928169"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The composite index is built before the owner index is dropped, so owner lookups always
+    # have an index to use.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_docker_image_batch_job_bundles_owner_name",
+            "docker_image_batch_job_bundles",
+            ["owner", "name", "created_at"],
+            schema="llm_engine",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_llm_engine_docker_image_batch_job_bundles_owner",
+            table_name="docker_image_batch_job_bundles",
+            schema="llm_engine",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_llm_engine_docker_image_batch_job_bundles_owner",
+            "docker_image_batch_job_bundles",
+            ["owner"],
+            schema="llm_engine",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_docker_image_batch_job_bundles_owner_name",
+            table_name="docker_image_batch_job_bundles",
+            schema="llm_engine",
+            postgresql_concurrently=True,
+        )
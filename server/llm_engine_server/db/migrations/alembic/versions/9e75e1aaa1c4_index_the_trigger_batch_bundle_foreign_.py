@@ -0,0 +1,35 @@
+"""index the trigger batch bundle foreign key
+
+Revision ID: 9e75e1aaa1c4
+Revises: 30154983fa4b
+Create Date: 2026-10-15 11:51:22.570247
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9e75e1aaa1c4"
+down_revision = "30154983fa4b"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_llm_engine_triggers_docker_image_batch_job_bundle_id",
+            "triggers",
+            ["docker_image_batch_job_bundle_id"],
+            schema="llm_engine",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_llm_engine_triggers_docker_image_batch_job_bundle_id",
+            table_name="triggers",
+            schema="llm_engine",
+            postgresql_concurrently=True,
+        )
@@ -1,3 +1,5 @@
+from sqlalchemy.engine import Engine
+
 from .base import Base, ml_infra_pg_engine
 
 # we need to import the following for sqlalchemy
@@ -6,5 +8,12 @@ from .models.llm_engine import Bundle, Endpoint  # noqa
 from .models.model import Model, ModelArtifact, ModelVersion  # noqa
 from .models.train import Execution, Experiment, Job, Snapshot  # noqa
 
+
+def init_schema(engine: Engine = ml_infra_pg_engine) -> None:
+    """Creates the tables for the db models imported above, skipping any that already exist."""
+    Base.metadata.create_all(engine)
+
+
 # run this file to create the db models imported
-Base.metadata.create_all(ml_infra_pg_engine)
+if __name__ == "__main__":
+    init_schema()
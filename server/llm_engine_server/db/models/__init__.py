@@ -1,6 +1,6 @@
 from typing import Sequence
 
-from .llm_engine import BatchJob, Bundle, DockerImageBatchJobBundle, Endpoint
+from .llm_engine import BatchJob, Bundle, DockerImageBatchJobBundle, Endpoint, EndpointSummary
 from .model import Model, ModelArtifact, ModelVersion
 
 __all__: Sequence[str] = [
@@ -8,6 +8,7 @@ __all__: Sequence[str] = [
     "Bundle",
     "DockerImageBatchJobBundle",
     "Endpoint",
+    "EndpointSummary",
     "Model",
     "ModelArtifact",
     "ModelVersion",
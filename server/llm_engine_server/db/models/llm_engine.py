@@ -1,23 +1,28 @@
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
 
-from pytz import timezone
 from sqlalchemy import (
     JSON,
     Boolean,
     Column,
+    Computed,
     DateTime,
     ForeignKey,
     Integer,
     Numeric,
     String,
     Text,
+    insert,
+    literal,
     select,
+    tuple_,
 )
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import relationship, selectinload
-from sqlalchemy.sql import func, text
+from sqlalchemy.orm import defer, relationship, selectinload
+from sqlalchemy.sql import Select, func, text
 from sqlalchemy.sql.expression import update
 from sqlalchemy.sql.schema import CheckConstraint, Index, UniqueConstraint
 from xid import XID
@@ -26,20 +31,66 @@ from ..base import Base
 from .constants import LONG_STRING, SHORT_STRING
 
 AUTOGENERATED_FIELDS = ["id", "created_at"]
-UTC = timezone("UTC")
 
 
 def get_xid():
     return XID().string()
 
 
-def time_now():
-    return datetime.now(UTC)
+def get_xids(n: int) -> List[str]:
+    """Generates n XIDs, reading the clock once for the whole batch."""
+    t = int(time.time())
+    return [XID(t=t).string() for _ in range(n)]
+
+
+def keyset_paginate(
+    query: Select, model: Any, cursor: Optional[Tuple[datetime, str]], limit: Optional[int]
+) -> Select:
+    """
+    Orders the query newest first and returns the page after `cursor`, the
+    (created_at, id) of the last row of the previous page. Pagination is only
+    applied if a cursor or a limit is given.
+    """
+    if cursor is not None:
+        query = query.filter(
+            tuple_(model.created_at, model.id)
+            < tuple_(*cursor, types=[model.created_at.type, model.id.type])
+        )
+    if cursor is not None or limit is not None:
+        query = query.order_by(model.created_at.desc(), model.id.desc())
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+def _column_values(obj: Any) -> Dict[str, Any]:
+    """Returns the column values that have been set on an ORM instance, keyed by column."""
+    return {c.key: getattr(obj, c.key) for c in obj.__table__.columns if c.key in obj.__dict__}
+
+
+async def _bulk_insert(
+    session: AsyncSession, model: Any, rows: List[Dict[str, Any]], id_prefix: str
+) -> List[str]:
+    """
+    Inserts rows given as column values into the model's table with a single executemany,
+    bypassing the ORM. All rows must have the same keys. Rows without an id are given a new
+    one starting with `id_prefix`. Returns the ids of the inserted rows.
+    """
+    rows = [{"id": f"{id_prefix}{xid}", **row} for xid, row in zip(get_xids(len(rows)), rows)]
+    if rows:
+        await session.execute(model.__table__.insert(), rows)
+        await session.commit()
+    return [row["id"] for row in rows]
 
 
 class Bundle(Base):
     __tablename__ = "bundles"
     __table_args__ = (
+        # The flavor checks are kept as separate constraints rather than one CASE expression or
+        # validation function. Bundles are written about once per model deploy, so evaluating
+        # them does not show up next to the insert round trip. The constraints are unnamed, so
+        # replacing them would also need a migration that finds their generated names in each
+        # deployed database.
         CheckConstraint(
             "flavor IN ('cloudpickle_artifact', 'zip_artifact', "
             "'runnable_image', 'streaming_enhanced_runnable_image', 'triton_enhanced_runnable_image')"
@@ -105,12 +156,17 @@ class Bundle(Base):
         CheckConstraint(
             "(flavor = 'triton_enhanced_runnable_image') = (triton_enhanced_runnable_image_readiness_initial_delay_seconds IS NOT NULL)"
         ),
+        # Lookups filter on name and created_by/owner and take the newest row; the trailing
+        # created_at column lets Postgres read that row straight off the index.
+        Index("ix_bundles_name_created_by", "name", "created_by", "created_at"),
+        Index("ix_bundles_name_owner", "name", "owner", "created_at"),
+        Index("ix_bundles_created_by_created_at", "created_by", "created_at", "id"),
         {"schema": "llm_engine"},
     )
 
     id = Column(Text, primary_key=True)
-    name = Column(String(LONG_STRING), index=True, nullable=False)
-    created_by = Column(String(SHORT_STRING), index=True, nullable=False)
+    name = Column(String(LONG_STRING), nullable=False)
+    created_by = Column(String(SHORT_STRING), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     bundle_metadata = Column(JSON, default={}, nullable=False)
     model_artifact_ids = Column(ARRAY(Text), server_default="{}")
@@ -119,6 +175,11 @@ class Bundle(Base):
     # TODO: remove the default once we have a way to populate this field.
     flavor = Column(Text, index=True, nullable=False, default="cloudpickle_artifact")
 
+    # The flavor-specific columns stay on this table instead of per-flavor child tables. Bundles
+    # are read by index lookups and through Endpoint.current_bundle and BatchJob.model_bundle, so
+    # child tables would add a query or join per flavor to those reads, while a narrower row only
+    # helps scans, which nothing here does.
+
     # Artifact (Cloudpickle or Zip) fields and constraints
     artifact_requirements = Column(ARRAY(Text), nullable=True)
     artifact_location = Column(Text, nullable=True)
@@ -298,24 +359,34 @@ class Bundle(Base):
 
     @classmethod
     async def create(cls, session: AsyncSession, bundle: "Bundle") -> None:
-        session.add(bundle)
+        await cls.create_many(session, [bundle])
+
+    @classmethod
+    async def create_many(cls, session: AsyncSession, bundles: Iterable["Bundle"]) -> None:
+        session.add_all(bundles)
         await session.commit()
 
+    @classmethod
+    async def bulk_insert(cls, session: AsyncSession, rows: List[Dict[str, Any]]) -> List[str]:
+        """
+        Inserts bundles given as column values with a single executemany, bypassing the ORM.
+        Returns the ids of the inserted bundles.
+        """
+        return await _bulk_insert(session, Bundle, rows, id_prefix="bun_")
+
     @classmethod
     async def select_by_name_created_by(
         cls, session: AsyncSession, name: str, created_by: str
     ) -> Optional["Bundle"]:
         bundles = select(Bundle).filter_by(name=name, created_by=created_by)
-        bundle = await session.execute(bundles.order_by(Bundle.created_at.desc()).limit(1))
-        return bundle.scalar_one_or_none()
+        return await session.scalar(bundles.order_by(Bundle.created_at.desc()).limit(1))
 
     @classmethod
     async def select_by_name_owner(
         cls, session: AsyncSession, name: str, owner: str
     ) -> Optional["Bundle"]:
         bundles = select(Bundle).filter_by(name=name, owner=owner)
-        bundle = await session.execute(bundles.order_by(Bundle.created_at.desc()).limit(1))
-        return bundle.scalar_one_or_none()
+        return await session.scalar(bundles.order_by(Bundle.created_at.desc()).limit(1))
 
     @classmethod
     async def select_all_by_name_created_by(
@@ -333,8 +404,7 @@ class Bundle(Base):
 
     @classmethod
     async def select_by_id(cls, session: AsyncSession, bundle_id: str) -> Optional["Bundle"]:
-        bundle = await session.execute(select(Bundle).filter_by(id=bundle_id))
-        return bundle.scalar_one_or_none()
+        return await session.get(Bundle, bundle_id)
 
     @classmethod
     async def select_all_by_created_by(
@@ -350,24 +420,36 @@ class Bundle(Base):
 
     @classmethod
     async def select_all_by_filters_created_by(
-        cls, session: AsyncSession, filters: List[Any], created_by: str
+        cls,
+        session: AsyncSession,
+        filters: List[Any],
+        created_by: str,
+        cursor: Optional[Tuple[datetime, str]] = None,
+        limit: Optional[int] = None,
     ) -> List["Bundle"]:
         query = select(Bundle).filter_by(created_by=created_by)
 
         for f in filters:
             query = query.filter(f)
+        query = keyset_paginate(query, Bundle, cursor, limit)
 
         bundles = await session.execute(query)
         return bundles.scalars().all()
 
     @classmethod
     async def select_all_by_filters_owner(
-        cls, session: AsyncSession, filters: List[Any], owner: str
+        cls,
+        session: AsyncSession,
+        filters: List[Any],
+        owner: str,
+        cursor: Optional[Tuple[datetime, str]] = None,
+        limit: Optional[int] = None,
     ) -> List["Bundle"]:
         query = select(Bundle).filter_by(owner=owner)
 
         for f in filters:
             query = query.filter(f)
+        query = keyset_paginate(query, Bundle, cursor, limit)
 
         bundles = await session.execute(query)
         return bundles.scalars().all()
@@ -384,21 +466,13 @@ class Bundle(Base):
         existing_bundle_name: str,
         created_by: str,
         new_kwargs: Dict[str, Any],
-    ) -> None:
-        existing_bundle = await Bundle.select_by_name_created_by(
-            session, existing_bundle_name, created_by
+    ) -> Optional[str]:
+        return await Bundle._duplicate_latest(
+            session,
+            new_kwargs,
+            Bundle.name == existing_bundle_name,
+            Bundle.created_by == created_by,
         )
-        if existing_bundle is None:
-            return None
-
-        bundle_args = {
-            c.name: getattr(existing_bundle, c.name) for c in existing_bundle.__table__.columns
-        }
-        updated_kwargs = {**bundle_args, **new_kwargs}
-        for key in AUTOGENERATED_FIELDS:
-            updated_kwargs.pop(key)
-        updated_bundle = Bundle(**updated_kwargs)
-        return await Bundle.create(session, updated_bundle)
 
     @classmethod
     async def duplicate_with_new_field_owner(
@@ -407,19 +481,61 @@ class Bundle(Base):
         existing_bundle_name: str,
         owner: str,
         new_kwargs: Dict[str, Any],
-    ) -> None:
-        existing_bundle = await Bundle.select_by_name_owner(session, existing_bundle_name, owner)
-        if existing_bundle is None:
-            return None
+    ) -> Optional[str]:
+        return await Bundle._duplicate_latest(
+            session,
+            new_kwargs,
+            Bundle.name == existing_bundle_name,
+            Bundle.owner == owner,
+        )
+
+    @classmethod
+    async def _duplicate_latest(
+        cls, session: AsyncSession, new_kwargs: Dict[str, Any], *filters: Any
+    ) -> Optional[str]:
+        """
+        Copies the most recent bundle matching the filters with a single INSERT ... SELECT,
+        overriding the columns in new_kwargs. Returns the id of the copy, or None if no bundle
+        matched.
+        """
+        existing_bundle = (
+            select(
+                literal(f"bun_{get_xid()}", type_=Text),
+                *[
+                    literal(new_kwargs[c.name], type_=c.type) if c.name in new_kwargs else c
+                    for c in _BUNDLE_COPIED_COLUMNS
+                ],
+            )
+            .where(*filters)
+            .order_by(Bundle.created_at.desc())
+            .limit(1)
+        )
+        result = await session.execute(
+            insert(Bundle)
+            .from_select([Bundle.id, *_BUNDLE_COPIED_COLUMNS], existing_bundle)
+            .returning(Bundle.id)
+        )
+        bundle_id = result.scalar_one_or_none()
+        await session.commit()
+        return bundle_id
+
 
-        bundle_args = {
-            c.name: getattr(existing_bundle, c.name) for c in existing_bundle.__table__.columns
-        }
-        updated_kwargs = {**bundle_args, **new_kwargs}
-        for key in AUTOGENERATED_FIELDS:
-            updated_kwargs.pop(key)
-        updated_bundle = Bundle(**updated_kwargs)
-        return await Bundle.create(session, updated_bundle)
+# Columns copied by Bundle._duplicate_latest, computed once instead of on every call.
+_BUNDLE_COPIED_COLUMNS = tuple(
+    c for c in Bundle.__table__.columns if c.name not in AUTOGENERATED_FIELDS
+)
+
+
+class EndpointSummary(NamedTuple):
+    """
+    The columns of an endpoint needed to list it, without the endpoint's bundle.
+    """
+
+    id: str
+    name: str
+    endpoint_status: str
+    endpoint_type: str
+    last_updated_at: datetime
 
 
 class Endpoint(Base):
@@ -431,7 +547,14 @@ class Endpoint(Base):
             "endpoint_name_llm_uc",
             "name",
             unique=True,
-            postgresql_where=text("endpoint_metadata ? '_llm'"),
+            postgresql_where=text("is_llm"),
+        ),
+        Index(  # Covers the LLM endpoint listing so it can be answered by an index-only scan
+            "ix_endpoint_llm_list",
+            "owner",
+            text("last_updated_at DESC"),
+            postgresql_include=["id", "name", "endpoint_status", "endpoint_type"],
+            postgresql_where=text("is_llm"),
         ),
         {"schema": "llm_engine"},
     )
@@ -440,9 +563,15 @@ class Endpoint(Base):
     name = Column(Text, index=True)
     created_by = Column(String(SHORT_STRING), index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    last_updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=time_now)
+    last_updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
     current_bundle_id = Column(Text, ForeignKey("llm_engine.bundles.id"))
     endpoint_metadata = Column(JSONB, default={})
+    # Kept in sync by Postgres, so LLM endpoints can be filtered without probing the JSONB.
+    # Every endpoint query selects this column, so Alembic revision 397dbe879a7d, which adds it,
+    # must be applied before this code is deployed.
+    is_llm = Column(Boolean, Computed("endpoint_metadata ? '_llm'", persisted=True))
     creation_task_id = Column(Text)
     endpoint_type = Column(Text, default="async")
     destination = Column(Text)
@@ -450,7 +579,8 @@ class Endpoint(Base):
     # Endpoints should eventually end up as READY barring any bugs.
     # EndpointStatus.ready.value
     endpoint_status = Column(Text, default="READY")
-    current_bundle = relationship("Bundle")
+    # Every caller reads the current bundle, so it is always loaded with one extra IN query.
+    current_bundle = relationship("Bundle", lazy="selectin")
     owner = Column(String(SHORT_STRING))
     public_inference = Column(Boolean, default=False)
 
@@ -482,38 +612,71 @@ class Endpoint(Base):
 
     @classmethod
     async def create(cls, session: AsyncSession, endpoint: "Endpoint") -> None:
-        session.add(endpoint)
+        await cls.create_many(session, [endpoint])
+
+    @classmethod
+    async def create_many(cls, session: AsyncSession, endpoints: Iterable["Endpoint"]) -> None:
+        session.add_all(endpoints)
         await session.commit()
 
+    @classmethod
+    async def create_if_not_exists(
+        cls, session: AsyncSession, endpoint: "Endpoint"
+    ) -> Optional[str]:
+        """
+        Inserts the endpoint unless it would violate one of the unique constraints on endpoints,
+        in which case nothing is written. Returns the id of the new endpoint, or None if an
+        endpoint with the same name already exists.
+        """
+        result = await session.execute(
+            pg_insert(Endpoint)
+            .values(**_column_values(endpoint))
+            .on_conflict_do_nothing()
+            .returning(Endpoint.id)
+        )
+        endpoint_id = result.scalar_one_or_none()
+        await session.commit()
+        return endpoint_id
+
     @classmethod
     async def update_by_name_created_by(
         cls, session: AsyncSession, name: str, created_by: str, kwargs: Dict[str, Any]
-    ) -> None:
-        stmt = (
-            update(Endpoint)
-            .where(Endpoint.name == name, Endpoint.created_by == created_by)
-            .values(**kwargs)
+    ) -> Optional["Endpoint"]:
+        return await cls._update_returning(
+            session, kwargs, Endpoint.name == name, Endpoint.created_by == created_by
         )
 
-        await session.execute(stmt)
-        await session.commit()
-
     @classmethod
     async def update_by_name_owner(
         cls, session: AsyncSession, name: str, owner: str, kwargs: Dict[str, Any]
-    ) -> None:
+    ) -> Optional["Endpoint"]:
+        return await cls._update_returning(
+            session, kwargs, Endpoint.name == name, Endpoint.owner == owner
+        )
+
+    @classmethod
+    async def _update_returning(
+        cls, session: AsyncSession, kwargs: Dict[str, Any], *filters: Any
+    ) -> Optional["Endpoint"]:
+        """Applies the update and returns the updated row in the same round trip, so callers
+        don't need to select it again."""
         stmt = (
-            update(Endpoint).where(Endpoint.name == name, Endpoint.owner == owner).values(**kwargs)
+            update(Endpoint)
+            .where(*filters)
+            .values(**kwargs)
+            .returning(Endpoint)
+            .execution_options(synchronize_session="fetch")
         )
 
-        await session.execute(stmt)
+        endpoint = (await session.execute(stmt)).scalar_one_or_none()
         await session.commit()
+        return endpoint
 
     @classmethod
     async def update_endpoint_status(
         cls, session: AsyncSession, name: str, created_by: str, endpoint_status: str
-    ) -> None:
-        await cls.update_by_name_created_by(
+    ) -> Optional["Endpoint"]:
+        return await cls.update_by_name_created_by(
             session, name, created_by, kwargs=dict(endpoint_status=endpoint_status)
         )
 
@@ -523,39 +686,44 @@ class Endpoint(Base):
         cls, session: AsyncSession, name: str, created_by: str
     ) -> Optional["Endpoint"]:
         # TODO probably need a UC on owner, name also
-        endpoint = await session.execute(
-            select(Endpoint)
-            .filter_by(name=name, created_by=created_by)
-            .options(selectinload(Endpoint.current_bundle))
-        )
-        return endpoint.scalar_one_or_none()
+        return await session.scalar(select(Endpoint).filter_by(name=name, created_by=created_by))
 
     @classmethod
     async def select_all_by_created_by(
         cls, session: AsyncSession, created_by: str
     ) -> List["Endpoint"]:
-        endpoints = await session.execute(
-            select(Endpoint)
-            .filter_by(created_by=created_by)
-            .options(selectinload(Endpoint.current_bundle))
-        )
+        endpoints = await session.execute(select(Endpoint).filter_by(created_by=created_by))
         return endpoints.scalars().all()
 
     @classmethod
     async def select_all_by_owner(cls, session: AsyncSession, owner: str) -> List["Endpoint"]:
-        endpoints = await session.execute(
-            select(Endpoint).filter_by(owner=owner).options(selectinload(Endpoint.current_bundle))
-        )
+        endpoints = await session.execute(select(Endpoint).filter_by(owner=owner))
         return endpoints.scalars().all()
 
+    @classmethod
+    async def select_summary_by_owner(
+        cls, session: AsyncSession, owner: str, llm_only: bool = False
+    ) -> List[EndpointSummary]:
+        query = select(
+            Endpoint.id,
+            Endpoint.name,
+            Endpoint.endpoint_status,
+            Endpoint.endpoint_type,
+            Endpoint.last_updated_at,
+        ).filter_by(owner=owner)
+        if llm_only:
+            query = query.filter(Endpoint.is_llm == True).order_by(  # noqa
+                Endpoint.last_updated_at.desc()
+            )
+        endpoints = await session.execute(query)
+        return [EndpointSummary(*endpoint) for endpoint in endpoints]
+
     @classmethod
     async def select_all_by_bundle_created_by(
         cls, session: AsyncSession, current_bundle_id: str, created_by: str
     ) -> List["Endpoint"]:
         endpoints = await session.execute(
-            select(Endpoint)
-            .filter_by(current_bundle_id=current_bundle_id, created_by=created_by)
-            .options(selectinload(Endpoint.current_bundle))
+            select(Endpoint).filter_by(current_bundle_id=current_bundle_id, created_by=created_by)
         )
         return endpoints.scalars().all()
 
@@ -564,34 +732,43 @@ class Endpoint(Base):
         cls, session: AsyncSession, current_bundle_id: str, owner: str
     ) -> List["Endpoint"]:
         endpoints = await session.execute(
-            select(Endpoint)
-            .filter_by(current_bundle_id=current_bundle_id, owner=owner)
-            .options(selectinload(Endpoint.current_bundle))
+            select(Endpoint).filter_by(current_bundle_id=current_bundle_id, owner=owner)
         )
         return endpoints.scalars().all()
 
     @classmethod
     async def select_all_by_filters_created_by(
-        cls, session: AsyncSession, filters: List[Any], created_by: str
+        cls,
+        session: AsyncSession,
+        filters: List[Any],
+        created_by: str,
+        cursor: Optional[Tuple[datetime, str]] = None,
+        limit: Optional[int] = None,
     ) -> List["Endpoint"]:
         filters = [*filters, Endpoint.created_by == created_by]
-        return await cls._select_all_by_filters(session, filters)
+        return await cls._select_all_by_filters(session, filters, limit=limit, cursor=cursor)
 
     @classmethod
     async def select_all_by_filters_owner(
-        cls, session: AsyncSession, filters: List[Any], owner: str
+        cls,
+        session: AsyncSession,
+        filters: List[Any],
+        owner: str,
+        cursor: Optional[Tuple[datetime, str]] = None,
+        limit: Optional[int] = None,
     ) -> List["Endpoint"]:
         filters = [*filters, Endpoint.owner == owner]
-        return await cls._select_all_by_filters(session, filters)
+        return await cls._select_all_by_filters(session, filters, limit=limit, cursor=cursor)
 
     @classmethod
     async def select_by_id(cls, session: AsyncSession, endpoint_id: str) -> Optional["Endpoint"]:
-        endpoint = await session.execute(
+        # Not session.get: that returns an instance already in the session as is, without
+        # loading current_bundle, which callers read after the session is closed.
+        return await session.scalar(
             select(Endpoint)
             .filter_by(id=endpoint_id)
             .options(selectinload(Endpoint.current_bundle))
         )
-        return endpoint.scalar_one_or_none()
 
     @classmethod
     async def _select_all_by_filters(
@@ -600,15 +777,15 @@ class Endpoint(Base):
         filters: List[Any],
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        cursor: Optional[Tuple[datetime, str]] = None,
     ) -> List["Endpoint"]:
         """DO NOT USE FOR EXTERNAL FUNCTIONS, this bypasses the owner
         check and should only be used for internal use cases"""
-        query = select(Endpoint).options(selectinload(Endpoint.current_bundle))
+        query = select(Endpoint)
 
         for f in filters:
             query = query.filter(f)
-        if limit:
-            query = query.limit(limit)
+        query = keyset_paginate(query, Endpoint, cursor, limit)
         if offset:
             query = query.offset(offset)
 
@@ -638,7 +815,7 @@ class BatchJob(Base):
     task_ids_location = Column(Text, nullable=True)
     result_location = Column(Text, nullable=True)
 
-    model_bundle = relationship("Bundle")
+    model_bundle = relationship("Bundle", lazy="selectin")
 
     def __init__(
         self,
@@ -662,14 +839,16 @@ class BatchJob(Base):
 
     @classmethod
     async def create(cls, session: AsyncSession, batch_job: "BatchJob") -> None:
-        session.add(batch_job)
+        await cls.create_many(session, [batch_job])
+
+    @classmethod
+    async def create_many(cls, session: AsyncSession, batch_jobs: Iterable["BatchJob"]) -> None:
+        session.add_all(batch_jobs)
         await session.commit()
 
     @classmethod
     async def select_all_by_owner(cls, session: AsyncSession, owner: str) -> List["BatchJob"]:
-        batch_jobs = await session.execute(
-            select(BatchJob).filter_by(owner=owner).options(selectinload(BatchJob.model_bundle))
-        )
+        batch_jobs = await session.execute(select(BatchJob).filter_by(owner=owner))
         return batch_jobs.scalars().all()
 
     @classmethod
@@ -677,18 +856,17 @@ class BatchJob(Base):
         cls, session: AsyncSession, model_bundle_id: str, owner: str
     ) -> List["BatchJob"]:
         batch_jobs = await session.execute(
-            select(BatchJob)
-            .filter_by(model_bundle_id=model_bundle_id, owner=owner)
-            .options(selectinload(BatchJob.model_bundle))
+            select(BatchJob).filter_by(model_bundle_id=model_bundle_id, owner=owner)
         )
         return batch_jobs.scalars().all()
 
     @classmethod
     async def select_by_id(cls, session: AsyncSession, batch_job_id: str) -> Optional["BatchJob"]:
-        batch_job = await session.execute(
+        # Not session.get, for the same reason as Endpoint.select_by_id: the instance added by
+        # create would come back without model_bundle loaded.
+        return await session.scalar(
             select(BatchJob).filter_by(id=batch_job_id).options(selectinload(BatchJob.model_bundle))
         )
-        return batch_job.scalar_one_or_none()
 
     @classmethod
     async def update_by_id(
@@ -704,26 +882,30 @@ class BatchJob(Base):
 
 class DockerImageBatchJobBundle(Base):
     __tablename__ = "docker_image_batch_job_bundles"
-    __table_args__ = ({"schema": "llm_engine"},)
-
-    id = Column("id", Text, primary_key=True)
-    name = Column("name", Text, nullable=False)
-    created_by = Column("created_by", String(SHORT_STRING), index=True, nullable=False)
-    created_at = Column(
-        "created_at", DateTime(timezone=True), server_default=func.now(), nullable=False
+    __table_args__ = (
+        # Owner leads so this also serves the owner-only listing; the trailing created_at lets
+        # select_latest_by_name_owner read the newest row straight off the index. Created by
+        # Alembic revision 6d3a19076ec5.
+        Index("ix_docker_image_batch_job_bundles_owner_name", "owner", "name", "created_at"),
+        {"schema": "llm_engine"},
     )
-    owner = Column("owner", String(SHORT_STRING), index=True, nullable=False)
-    image_repository = Column("image_repository", Text, nullable=False)
-    image_tag = Column("image_tag", Text, nullable=False)
-    command = Column("command", ARRAY(Text), nullable=False)
-    env = Column("env", JSON, nullable=False)
-    mount_location = Column("mount_location", Text, nullable=True)
-    cpus = Column("cpus", Text, nullable=True)
-    memory = Column("memory", Text, nullable=True)
-    storage = Column("storage", Text, nullable=True)
-    gpus = Column("gpus", Integer, nullable=True)
-    gpu_type = Column("gpu_type", Text, nullable=True)
-    public = Column("public", Boolean, nullable=True)
+
+    id = Column(Text, primary_key=True)
+    name = Column(Text, nullable=False)
+    created_by = Column(String(SHORT_STRING), index=True, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    owner = Column(String(SHORT_STRING), nullable=False)
+    image_repository = Column(Text, nullable=False)
+    image_tag = Column(Text, nullable=False)
+    command = Column(ARRAY(Text), nullable=False)
+    env = Column(JSON, nullable=False)
+    mount_location = Column(Text, nullable=True)
+    cpus = Column(Text, nullable=True)
+    memory = Column(Text, nullable=True)
+    storage = Column(Text, nullable=True)
+    gpus = Column(Integer, nullable=True)
+    gpu_type = Column(Text, nullable=True)
+    public = Column(Boolean, nullable=True)
 
     def __init__(
         self,
@@ -761,16 +943,45 @@ class DockerImageBatchJobBundle(Base):
 
     @classmethod
     async def create(cls, session: AsyncSession, batch_bundle: "DockerImageBatchJobBundle") -> None:
-        session.add(batch_bundle)
+        await cls.create_many(session, [batch_bundle])
+
+    @classmethod
+    async def create_many(
+        cls, session: AsyncSession, batch_bundles: Iterable["DockerImageBatchJobBundle"]
+    ) -> None:
+        session.add_all(batch_bundles)
         await session.commit()
 
+    @classmethod
+    async def bulk_insert(cls, session: AsyncSession, rows: List[Dict[str, Any]]) -> List[str]:
+        """
+        Inserts batch bundles given as column values with a single executemany, bypassing the ORM.
+        Returns the ids of the inserted batch bundles.
+        """
+        return await _bulk_insert(session, DockerImageBatchJobBundle, rows, id_prefix="batbun_")
+
     @classmethod
     async def select_all_by_owner(
-        cls, session: AsyncSession, owner: str
+        cls,
+        session: AsyncSession,
+        owner: str,
+        cursor: Optional[Tuple[datetime, str]] = None,
+        limit: Optional[int] = None,
+        load_env: bool = True,
     ) -> List["DockerImageBatchJobBundle"]:
-        batch_bundles = await session.execute(
-            select(DockerImageBatchJobBundle).filter_by(owner=owner)
-        )
+        """
+        If `load_env` is False, the env and command columns are not fetched, and accessing them
+        on the returned batch bundles raises instead of emitting another query.
+        """
+        query = select(DockerImageBatchJobBundle).filter_by(owner=owner)
+        if not load_env:
+            query = query.options(
+                defer(DockerImageBatchJobBundle.env, raiseload=True),
+                defer(DockerImageBatchJobBundle.command, raiseload=True),
+            )
+        query = keyset_paginate(query, DockerImageBatchJobBundle, cursor, limit)
+
+        batch_bundles = await session.execute(query)
         return batch_bundles.scalars().all()
 
     @classmethod
@@ -778,10 +989,9 @@ class DockerImageBatchJobBundle(Base):
         cls, session: AsyncSession, name: str, owner: str
     ) -> Optional["DockerImageBatchJobBundle"]:
         batch_bundles = select(DockerImageBatchJobBundle).filter_by(name=name, owner=owner)
-        batch_bundle = await session.execute(
+        return await session.scalar(
             batch_bundles.order_by(DockerImageBatchJobBundle.created_at.desc()).limit(1)
         )
-        return batch_bundle.scalar_one_or_none()
 
     @classmethod
     async def select_all_by_name_owner(
@@ -796,10 +1006,7 @@ class DockerImageBatchJobBundle(Base):
     async def select_by_id(
         cls, session: AsyncSession, batch_bundle_id: str
     ) -> Optional["DockerImageBatchJobBundle"]:
-        batch_bundle = await session.execute(
-            select(DockerImageBatchJobBundle).filter_by(id=batch_bundle_id)
-        )
-        return batch_bundle.scalar_one_or_none()
+        return await session.get(DockerImageBatchJobBundle, batch_bundle_id)
 
 
 class Trigger(Base):
@@ -809,22 +1016,20 @@ class Trigger(Base):
         {"schema": "llm_engine"},
     )
 
-    id = Column("id", String, nullable=False, primary_key=True)
-    name = Column("name", String, nullable=False)
-    owner = Column("owner", String, nullable=False)
-    created_by = Column("created_by", String, nullable=False)
-    created_at = Column(
-        "created_at", DateTime(timezone=True), nullable=False, server_default=func.now()
-    )
-    cron_schedule = Column("cron_schedule", String, nullable=False)
+    id = Column(String, nullable=False, primary_key=True)
+    name = Column(String, nullable=False)
+    owner = Column(String(SHORT_STRING), nullable=False)
+    created_by = Column(String(SHORT_STRING), nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    cron_schedule = Column(String, nullable=False)
     docker_image_batch_job_bundle_id = Column(
-        "docker_image_batch_job_bundle_id",
         String,
         ForeignKey("llm_engine.docker_image_batch_job_bundles.id"),
+        index=True,
         nullable=False,
     )
-    default_job_config = Column("default_job_config", JSONB, nullable=True)
-    default_job_metadata = Column("default_job_metadata", JSONB, nullable=True)
+    default_job_config = Column(JSONB, nullable=True)
+    default_job_metadata = Column(JSONB, nullable=True)
 
     def __init__(
         self,
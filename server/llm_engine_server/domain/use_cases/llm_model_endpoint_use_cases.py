@@ -1,8 +1,10 @@
+import asyncio
 import json
 from dataclasses import asdict
 from typing import Any, AsyncIterable, Dict, Optional
 
 from llm_engine_server.common.dtos.llms import (
+    BatchGetLLMModelEndpointsV1Request,
     CompletionOutput,
     CompletionStreamOutput,
     CompletionStreamV1Request,
@@ -57,6 +59,9 @@ from .model_endpoint_use_cases import (
 
 logger = make_logger(filename_wo_ext(__name__))
 
+# Maximum number of model endpoints looked up at the same time by a batch get.
+MAX_CONCURRENT_BATCH_GET_LOOKUPS = 20
+
 _SUPPORTED_MODEL_NAMES = {
     LLMInferenceFramework.DEEPSPEED: {
         "mpt-7b": "mosaicml/mpt-7b",
@@ -493,6 +498,63 @@ class GetLLMModelEndpointByNameV1UseCase:
         return _model_endpoint_entity_to_get_llm_model_endpoint_response(model_endpoint)
 
 
+class BatchGetLLMModelEndpointsV1UseCase:
+    """
+    Use case for getting several LLM Model Endpoints of a given user by name in one request.
+    """
+
+    def __init__(self, llm_model_endpoint_service: LLMModelEndpointService):
+        self.llm_model_endpoint_service = llm_model_endpoint_service
+        self.authz_module = ScaleAuthorizationModule()
+
+    async def execute(
+        self, user: User, request: BatchGetLLMModelEndpointsV1Request
+    ) -> ListLLMModelEndpointsV1Response:
+        """
+        Runs the use case to get the LLM endpoints with the given names.
+
+        Args:
+            user: The owner of the model endpoints.
+            request: The request object that contains the names of the model endpoints.
+
+        Returns:
+            A response object that contains the model endpoints, in the same order as the names.
+
+        Raises:
+            ObjectNotFoundException: If a model endpoint with one of the names could not be found.
+            ObjectNotAuthorizedException: If the owner does not own one of the model endpoints.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCH_GET_LOOKUPS)
+
+        async def get_llm_model_endpoint(model_endpoint_name: str) -> Optional[ModelEndpoint]:
+            async with semaphore:
+                return await self.llm_model_endpoint_service.get_llm_model_endpoint(
+                    model_endpoint_name
+                )
+
+        unique_names = list(dict.fromkeys(request.names))
+        results = await asyncio.gather(*[get_llm_model_endpoint(name) for name in unique_names])
+        model_endpoints_by_name: Dict[str, ModelEndpoint] = {}
+        for model_endpoint_name, model_endpoint in zip(unique_names, results):
+            if not model_endpoint:
+                raise ObjectNotFoundException
+            if not self.authz_module.check_access_read_owned_entity(
+                user, model_endpoint.record
+            ) and not self.authz_module.check_endpoint_public_inference_for_user(
+                user, model_endpoint.record
+            ):
+                raise ObjectNotAuthorizedException
+            model_endpoints_by_name[model_endpoint_name] = model_endpoint
+        return ListLLMModelEndpointsV1Response(
+            model_endpoints=[
+                _model_endpoint_entity_to_get_llm_model_endpoint_response(
+                    model_endpoints_by_name[model_endpoint_name]
+                )
+                for model_endpoint_name in request.names
+            ]
+        )
+
+
 class DeleteLLMModelEndpointByIdV1UseCase:
     pass
 
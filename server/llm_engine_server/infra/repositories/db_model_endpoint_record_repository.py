@@ -5,6 +5,7 @@ from typing import Any, Callable, Dict, List, Optional
 from cachetools import TTLCache
 from llm_engine_server.common import dict_not_none
 from llm_engine_server.common.dtos.model_endpoints import ModelEndpointOrderBy
+from llm_engine_server.core.domain_exceptions import ObjectAlreadyExistsException
 from llm_engine_server.core.loggers import filename_wo_ext, make_logger
 from llm_engine_server.db.endpoint_row_lock import AdvisoryLockContextManager, get_lock_key
 from llm_engine_server.db.models import Endpoint as OrmModelEndpoint
@@ -20,7 +21,7 @@ from llm_engine_server.infra.repositories.db_repository_mixin import (
 from llm_engine_server.infra.repositories.model_endpoint_record_repository import (
     ModelEndpointRecordRepository,
 )
-from sqlalchemy import or_, text
+from sqlalchemy import or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = make_logger(filename_wo_ext(__file__))
@@ -134,7 +135,9 @@ class DbModelEndpointRecordRepository(ModelEndpointRecordRepository, DbRepositor
             public_inference=public_inference,
         )
         async with self.session() as session:
-            await OrmModelEndpoint.create(session, model_endpoint_record)
+            # Let the unique constraints detect duplicates instead of selecting first.
+            if await OrmModelEndpoint.create_if_not_exists(session, model_endpoint_record) is None:
+                raise ObjectAlreadyExistsException
 
             # HACK: Force a select_by_id to load the current_model_bundle relationship into the current session.
             # Otherwise, we'll get an error like:
@@ -195,7 +198,7 @@ class DbModelEndpointRecordRepository(ModelEndpointRecordRepository, DbRepositor
         if model_endpoints is None:
             self.monitoring_metrics_gateway.emit_database_cache_miss_metric()
             filters: List[Any] = []
-            filters.append(text("endpoint_metadata ? '_llm'"))
+            filters.append(OrmModelEndpoint.is_llm == True)  # noqa
             if name:
                 filters.append(OrmModelEndpoint.name == name)
             ownership_filters = []
@@ -258,7 +261,7 @@ class DbModelEndpointRecordRepository(ModelEndpointRecordRepository, DbRepositor
                 model_endpoints_orm = await OrmModelEndpoint._select_all_by_filters(
                     session=session,
                     filters=[
-                        text("endpoint_metadata ? '_llm'"),
+                        OrmModelEndpoint.is_llm == True,  # noqa
                         OrmModelEndpoint.name == model_endpoint_name,
                     ],
                 )
@@ -325,15 +328,14 @@ class DbModelEndpointRecordRepository(ModelEndpointRecordRepository, DbRepositor
                 last_updated_at=datetime.utcnow(),
                 public_inference=public_inference,
             )
-            await OrmModelEndpoint.update_by_name_owner(
+            updated_model_endpoint_orm = await OrmModelEndpoint.update_by_name_owner(
                 session=session,
                 name=model_endpoint_orm.name,
                 owner=model_endpoint_orm.owner,
                 kwargs=update_kwargs,
             )
-            updated_model_endpoint_orm = await OrmModelEndpoint.select_by_id(
-                session=session, endpoint_id=model_endpoint_id
-            )
+            if updated_model_endpoint_orm is None:
+                return None
 
         model_endpoint = translate_model_endpoint_orm_to_model_endpoint_record(
             updated_model_endpoint_orm
@@ -69,6 +69,9 @@ class ModelEndpointRecordRepository(ABC):
 
         Returns:
             A Model Endpoint Record domain entity.
+
+        Raises:
+            ObjectAlreadyExistsException: If an endpoint with the same name already exists.
         """
 
     @abstractmethod
@@ -3,10 +3,7 @@ from typing import Any, Dict, List, Optional
 from datadog import statsd
 from llm_engine_server.common.dtos.model_endpoints import ModelEndpointOrderBy
 from llm_engine_server.common.settings import generate_deployment_name
-from llm_engine_server.core.domain_exceptions import (
-    ObjectAlreadyExistsException,
-    ObjectNotFoundException,
-)
+from llm_engine_server.core.domain_exceptions import ObjectNotFoundException
 from llm_engine_server.core.loggers import filename_wo_ext, make_logger
 from llm_engine_server.domain.entities import (
     CallbackAuth,
@@ -149,14 +146,6 @@ class LiveModelEndpointService(ModelEndpointService):
         default_callback_auth: Optional[CallbackAuth],
         public_inference: Optional[bool] = False,
     ) -> ModelEndpointRecord:
-        existing_endpoints = (
-            await self.model_endpoint_record_repository.list_model_endpoint_records(
-                owner=owner, name=name, order_by=None
-            )
-        )
-        if len(existing_endpoints) > 0:
-            raise ObjectAlreadyExistsException
-
         model_endpoint_record = (
             await self.model_endpoint_record_repository.create_model_endpoint_record(
                 name=name,
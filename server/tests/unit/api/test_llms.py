@@ -82,6 +82,34 @@ def test_get_llm_model_endpoint_success(
     assert response_1.json() == expected_model_endpoint_1
 
 
+def test_batch_get_llm_model_endpoints_success(
+    llm_model_endpoint_sync: Tuple[ModelEndpoint, Any],
+    model_endpoint_2: Tuple[ModelEndpoint, Any],
+    get_test_client_wrapper,
+):
+    client = get_test_client_wrapper(
+        fake_model_endpoint_record_repository_contents={
+            llm_model_endpoint_sync[0].record.id: llm_model_endpoint_sync[0].record,
+        },
+        fake_model_endpoint_infra_gateway_contents={
+            llm_model_endpoint_sync[0]
+            .infra_state.deployment_name: llm_model_endpoint_sync[0]
+            .infra_state,
+            model_endpoint_2[0].infra_state.deployment_name: model_endpoint_2[0].infra_state,
+        },
+    )
+    response_1 = client.post(
+        "/v1/llm/model-endpoints:batchGet",
+        auth=("no_user", ""),
+        json={"names": [llm_model_endpoint_sync[0].record.name]},
+    )
+    expected_model_endpoint_1 = json.loads(
+        GetLLMModelEndpointV1Response.parse_obj(llm_model_endpoint_sync[1]).json()
+    )
+    assert response_1.status_code == 200
+    assert response_1.json() == {"model_endpoints": [expected_model_endpoint_1]}
+
+
 def test_completion_sync_success(
     llm_model_endpoint_sync: Tuple[ModelEndpoint, Any],
     completion_sync_request: Dict[str, Any],
@@ -39,7 +39,10 @@ from llm_engine_server.common.dtos.tasks import (
     TaskStatus,
 )
 from llm_engine_server.common.settings import generate_destination
-from llm_engine_server.core.domain_exceptions import ObjectNotFoundException
+from llm_engine_server.core.domain_exceptions import (
+    ObjectAlreadyExistsException,
+    ObjectNotFoundException,
+)
 from llm_engine_server.core.fake_notification_gateway import FakeNotificationGateway
 from llm_engine_server.db.endpoint_row_lock import get_lock_key
 from llm_engine_server.db.models import BatchJob as OrmBatchJob
@@ -417,6 +420,8 @@ class FakeModelEndpointRecordRepository(ModelEndpointRecordRepository):
         owner: str,
         public_inference: Optional[bool] = False,
     ) -> ModelEndpointRecord:
+        if any(m.name == name and m.owner == owner for m in self.db.values()):
+            raise ObjectAlreadyExistsException
         orm_model_endpoint = OrmModelEndpoint(
             name=name,
             created_by=created_by,
@@ -0,0 +1,26 @@
+from typing import List
+
+import pytest
+from llm_engine_server.db.base import SessionAsync
+from llm_engine_server.db.models import Bundle
+from llm_engine_server.domain.entities import BatchJobStatus
+from llm_engine_server.infra.repositories.db_batch_job_record_repository import (
+    DbBatchJobRecordRepository,
+)
+
+
+@pytest.mark.asyncio
+async def test_create_batch_job_record_loads_model_bundle(
+    dbsession_async: SessionAsync, bundles: List[Bundle]
+):
+    # The repository closes its session before translating the ORM object, so the model_bundle
+    # relationship must already be loaded by then.
+    repo = DbBatchJobRecordRepository(session=lambda: dbsession_async, read_only=False)
+    batch_job = await repo.create_batch_job_record(
+        status=BatchJobStatus.PENDING,
+        created_by="test_user_1",
+        owner="test_user_1",
+        model_bundle_id=bundles[0].id,
+    )
+    assert batch_job.model_bundle.id == bundles[0].id
+    assert batch_job.model_bundle.name == bundles[0].name
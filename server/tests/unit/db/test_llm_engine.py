@@ -37,6 +37,27 @@ async def test_bundle_select(dbsession_async: SessionAsync, bundles: List[Bundle
     assert len(bundles_by_owner) == 2
 
 
+@pytest.mark.asyncio
+async def test_bundle_select_paginated(dbsession_async: SessionAsync, bundles: List[Bundle]):
+    all_bundles = await Bundle.select_all_by_filters_owner(
+        dbsession_async, filters=[], owner="test_user_1"
+    )
+    paginated_bundles: List[Bundle] = []
+    cursor = None
+    while True:
+        page = await Bundle.select_all_by_filters_owner(
+            dbsession_async, filters=[], owner="test_user_1", cursor=cursor, limit=2
+        )
+        if not page:
+            break
+        assert len(page) <= 2
+        paginated_bundles.extend(page)
+        cursor = (page[-1].created_at, page[-1].id)
+
+    assert len(paginated_bundles) == len(all_bundles)
+    assert {b.id for b in paginated_bundles} == {b.id for b in all_bundles}
+
+
 @pytest.mark.asyncio
 async def test_bundle_select_delete(dbsession_async: SessionAsync, bundles: List[Bundle]):
     bundles_by_owner = await Bundle.select_all_by_created_by(
@@ -53,6 +74,80 @@ async def test_bundle_select_delete(dbsession_async: SessionAsync, bundles: List
     assert len(bundles_by_owner) == prev_num_bundles - 1
 
 
+@pytest.mark.asyncio
+async def test_bundle_bulk_insert(dbsession_async: SessionAsync):
+    rows = [
+        dict(
+            name=f"test_bulk_bundle_{i}",
+            created_by="test_user_3",
+            owner="test_user_3",
+            flavor="cloudpickle_artifact",
+            artifact_requirements=["test_requirement_1"],
+            artifact_location="test_location_1",
+            artifact_framework_type="pytorch",
+            artifact_pytorch_image_tag="test_tag_1",
+            cloudpickle_artifact_load_predict_fn="test_load_predict_fn",
+            cloudpickle_artifact_load_model_fn="test_load_model_fn",
+            location="test_location_1",
+        )
+        for i in range(3)
+    ]
+    bundle_ids = await Bundle.bulk_insert(dbsession_async, rows)
+    assert len(set(bundle_ids)) == 3
+
+    bundles = await Bundle.select_all_by_created_by(dbsession_async, created_by="test_user_3")
+    assert {bundle.id for bundle in bundles} == set(bundle_ids)
+
+
+@pytest.mark.asyncio
+async def test_bundle_create_many(dbsession_async: SessionAsync):
+    new_bundles = [
+        Bundle(
+            name=f"test_create_many_bundle_{i}",
+            created_by="test_user_3",
+            owner="test_user_3",
+            flavor="cloudpickle_artifact",
+            artifact_requirements=["test_requirement_1"],
+            artifact_location="test_location_1",
+            artifact_framework_type="pytorch",
+            artifact_pytorch_image_tag="test_tag_1",
+            cloudpickle_artifact_load_predict_fn="test_load_predict_fn",
+            cloudpickle_artifact_load_model_fn="test_load_model_fn",
+            location="test_location_1",
+        )
+        for i in range(3)
+    ]
+    await Bundle.create_many(dbsession_async, new_bundles)
+
+    bundles = await Bundle.select_all_by_created_by(dbsession_async, created_by="test_user_3")
+    assert {bundle.id for bundle in bundles} == {bundle.id for bundle in new_bundles}
+
+
+@pytest.mark.asyncio
+async def test_bundle_duplicate(dbsession_async: SessionAsync, bundles: List[Bundle]):
+    bundle_id = await Bundle.duplicate_with_new_field_created_by(
+        dbsession_async,
+        existing_bundle_name="test_bundle_1",
+        created_by="test_user_1",
+        new_kwargs={"version": "v1"},
+    )
+    assert bundle_id is not None and bundle_id != bundles[0].id
+
+    bundle = await Bundle.select_by_id(dbsession_async, bundle_id=bundle_id)
+    assert bundle is not None
+    assert bundle.name == "test_bundle_1"
+    assert bundle.artifact_location == "test_location_1"
+    assert bundle.version == "v1"
+
+    missing_bundle_id = await Bundle.duplicate_with_new_field_owner(
+        dbsession_async,
+        existing_bundle_name="nonexistent_bundle",
+        owner="test_user_1",
+        new_kwargs={"version": "v1"},
+    )
+    assert missing_bundle_id is None
+
+
 @pytest.mark.asyncio
 async def test_endpoint_select(
     dbsession_async: SessionAsync, bundles: List[Bundle], endpoints: List[Endpoint]
@@ -76,6 +171,103 @@ async def test_endpoint_select(
     assert len(endpoints_by_bundle_owner) == 2
 
 
+@pytest.mark.asyncio
+async def test_endpoint_select_summary(
+    dbsession_async: SessionAsync, bundles: List[Bundle], endpoints: List[Endpoint]
+):
+    endpoint_summaries = await Endpoint.select_summary_by_owner(
+        dbsession_async, owner="test_user_1"
+    )
+    endpoints_by_owner = await Endpoint.select_all_by_owner(dbsession_async, owner="test_user_1")
+    assert {e.id for e in endpoint_summaries} == {e.id for e in endpoints_by_owner}
+    assert all(e.endpoint_status == "READY" for e in endpoint_summaries)
+
+    llm_endpoint_summaries = await Endpoint.select_summary_by_owner(
+        dbsession_async, owner="test_user_1", llm_only=True
+    )
+    assert llm_endpoint_summaries == []
+
+    llm_endpoint = Endpoint(
+        name="test_llm_endpoint_1",
+        created_by="test_user_1",
+        current_bundle_id=bundles[0].id,
+        endpoint_metadata={"_llm": {"model_name": "llama-7b"}},
+        endpoint_type="streaming",
+        endpoint_status="READY",
+        owner="test_user_1",
+    )
+    await Endpoint.create(dbsession_async, llm_endpoint)
+    llm_endpoint_summaries = await Endpoint.select_summary_by_owner(
+        dbsession_async, owner="test_user_1", llm_only=True
+    )
+    assert [e.id for e in llm_endpoint_summaries] == [llm_endpoint.id]
+
+
+@pytest.mark.asyncio
+async def test_endpoint_create_if_not_exists(
+    dbsession_async: SessionAsync, bundles: List[Bundle], endpoints: List[Endpoint]
+):
+    new_endpoint = Endpoint(
+        name="test_endpoint_4",
+        created_by="test_user_1",
+        current_bundle_id=bundles[0].id,
+        endpoint_type="async",
+        owner="test_user_1",
+    )
+    endpoint_id = await Endpoint.create_if_not_exists(dbsession_async, new_endpoint)
+    assert endpoint_id == new_endpoint.id
+
+    duplicate_endpoint = Endpoint(
+        name="test_endpoint_1",
+        created_by="test_user_1",
+        current_bundle_id=bundles[0].id,
+        endpoint_type="async",
+        owner="test_user_1",
+    )
+    endpoint_id = await Endpoint.create_if_not_exists(dbsession_async, duplicate_endpoint)
+    assert endpoint_id is None
+
+
+@pytest.mark.asyncio
+async def test_endpoint_create_many(dbsession_async: SessionAsync, bundles: List[Bundle]):
+    new_endpoints = [
+        Endpoint(
+            name=f"test_create_many_endpoint_{i}",
+            created_by="test_user_3",
+            current_bundle_id=bundles[0].id,
+            endpoint_type="async",
+            owner="test_user_3",
+        )
+        for i in range(3)
+    ]
+    await Endpoint.create_many(dbsession_async, new_endpoints)
+
+    endpoints = await Endpoint.select_all_by_owner(dbsession_async, owner="test_user_3")
+    assert {endpoint.id for endpoint in endpoints} == {endpoint.id for endpoint in new_endpoints}
+
+
+@pytest.mark.asyncio
+async def test_endpoint_update_returning(
+    dbsession_async: SessionAsync, bundles: List[Bundle], endpoints: List[Endpoint]
+):
+    updated_endpoint = await Endpoint.update_endpoint_status(
+        dbsession_async,
+        name="test_endpoint_1",
+        created_by="test_user_1",
+        endpoint_status="UPDATE_PENDING",
+    )
+    assert updated_endpoint is not None
+    assert updated_endpoint.endpoint_status == "UPDATE_PENDING"
+
+    missing_endpoint = await Endpoint.update_by_name_owner(
+        dbsession_async,
+        name="nonexistent_endpoint",
+        owner="test_user_1",
+        kwargs=dict(endpoint_status="UPDATE_PENDING"),
+    )
+    assert missing_endpoint is None
+
+
 @pytest.mark.asyncio
 async def test_endpoint_select_delete(
     dbsession_async: SessionAsync, bundles: List[Bundle], endpoints: List[Endpoint]
@@ -158,3 +350,73 @@ async def test_docker_image_batch_job_bundle_select(
     )
     assert batch_job_latest_by_name_owner is not None
     assert batch_job_latest_by_name_owner.id == docker_image_batch_job_bundles[1].id
+
+
+@pytest.mark.asyncio
+async def test_docker_image_batch_job_bundle_create_many(dbsession_async: SessionAsync):
+    new_batch_bundles = [
+        DockerImageBatchJobBundle(
+            name="test_create_many_batch_bundle",
+            created_by="test_user_3",
+            owner="test_user_3",
+            image_repository="image_repository",
+            image_tag=f"image_tag_{i}",
+            command=["python", "script.py"],
+            env=dict(ENV1="VAL1"),
+            mount_location=None,
+            cpus=None,
+            memory=None,
+            storage=None,
+            gpus=None,
+            gpu_type=None,
+        )
+        for i in range(3)
+    ]
+    await DockerImageBatchJobBundle.create_many(dbsession_async, new_batch_bundles)
+
+    batch_bundles = await DockerImageBatchJobBundle.select_all_by_owner(
+        dbsession_async, owner="test_user_3"
+    )
+    assert {batch_bundle.id for batch_bundle in batch_bundles} == {
+        batch_bundle.id for batch_bundle in new_batch_bundles
+    }
+
+
+@pytest.mark.asyncio
+async def test_docker_image_batch_job_bundle_bulk_insert(dbsession_async: SessionAsync):
+    rows = [
+        dict(
+            name="test_bulk_batch_bundle",
+            created_by="test_user_3",
+            owner="test_user_3",
+            image_repository="image_repository",
+            image_tag=f"image_tag_{i}",
+            command=["python", "script.py"],
+            env=dict(ENV1="VAL1"),
+        )
+        for i in range(3)
+    ]
+    batch_bundle_ids = await DockerImageBatchJobBundle.bulk_insert(dbsession_async, rows)
+    assert len(set(batch_bundle_ids)) == 3
+
+    batch_bundles = await DockerImageBatchJobBundle.select_all_by_owner(
+        dbsession_async, owner="test_user_3"
+    )
+    assert {batch_bundle.id for batch_bundle in batch_bundles} == set(batch_bundle_ids)
+
+
+@pytest.mark.asyncio
+async def test_docker_image_batch_job_bundle_select_paginated(
+    dbsession_async: SessionAsync,
+    docker_image_batch_job_bundles: List[DockerImageBatchJobBundle],
+):
+    first_page = await DockerImageBatchJobBundle.select_all_by_owner(
+        dbsession_async, owner="test_user_1", limit=1, load_env=False
+    )
+    assert [bb.id for bb in first_page] == [docker_image_batch_job_bundles[1].id]
+
+    last = first_page[-1]
+    second_page = await DockerImageBatchJobBundle.select_all_by_owner(
+        dbsession_async, owner="test_user_1", cursor=(last.created_at, last.id), limit=1
+    )
+    assert [bb.id for bb in second_page] == [docker_image_batch_job_bundles[0].id]
@@ -2,6 +2,7 @@ from typing import Any, Tuple
 
 import pytest
 from llm_engine_server.common.dtos.llms import (
+    BatchGetLLMModelEndpointsV1Request,
     CompletionOutput,
     CompletionStreamV1Request,
     CompletionSyncV1Request,
@@ -18,6 +19,7 @@ from llm_engine_server.core.domain_exceptions import (
 from llm_engine_server.domain.entities import ModelEndpoint, ModelEndpointType
 from llm_engine_server.domain.exceptions import EndpointUnsupportedInferenceTypeException
 from llm_engine_server.domain.use_cases.llm_model_endpoint_use_cases import (
+    BatchGetLLMModelEndpointsV1UseCase,
     CompletionStreamV1UseCase,
     CompletionSyncV1UseCase,
     CreateLLMModelEndpointV1UseCase,
@@ -230,6 +232,79 @@ async def test_get_llm_model_endpoint_use_case_raises_not_authorized(
         )
 
 
+@pytest.mark.asyncio
+async def test_batch_get_llm_model_endpoints_use_case_success(
+    test_api_key: str,
+    fake_llm_model_endpoint_service,
+    llm_model_endpoint_async: Tuple[ModelEndpoint, Any],
+):
+    fake_llm_model_endpoint_service.add_model_endpoint(llm_model_endpoint_async[0])
+    use_case = BatchGetLLMModelEndpointsV1UseCase(
+        llm_model_endpoint_service=fake_llm_model_endpoint_service
+    )
+    user = User(user_id=test_api_key, team_id=test_api_key, is_privileged_user=True)
+    names = [llm_model_endpoint_async[0].record.name]
+    response = await use_case.execute(
+        user=user, request=BatchGetLLMModelEndpointsV1Request(names=names)
+    )
+    assert [model_endpoint.name for model_endpoint in response.model_endpoints] == names
+
+
+@pytest.mark.asyncio
+async def test_batch_get_llm_model_endpoints_use_case_raises_not_found(
+    test_api_key: str,
+    fake_llm_model_endpoint_service,
+    llm_model_endpoint_async: Tuple[ModelEndpoint, Any],
+):
+    fake_llm_model_endpoint_service.add_model_endpoint(llm_model_endpoint_async[0])
+    use_case = BatchGetLLMModelEndpointsV1UseCase(
+        llm_model_endpoint_service=fake_llm_model_endpoint_service
+    )
+    user = User(user_id=test_api_key, team_id=test_api_key, is_privileged_user=True)
+    request = BatchGetLLMModelEndpointsV1Request(
+        names=[llm_model_endpoint_async[0].record.name, "invalid_model_endpoint_name"]
+    )
+    with pytest.raises(ObjectNotFoundException):
+        await use_case.execute(user=user, request=request)
+
+
+@pytest.mark.asyncio
+async def test_batch_get_llm_model_endpoints_use_case_multiple_names(
+    test_api_key: str,
+    fake_llm_model_endpoint_service,
+    llm_model_endpoint_async: Tuple[ModelEndpoint, Any],
+    llm_model_endpoint_streaming: ModelEndpoint,
+    llm_model_endpoint_text_generation_inference: ModelEndpoint,
+):
+    fake_llm_model_endpoint_service.add_model_endpoint(llm_model_endpoint_async[0])
+    fake_llm_model_endpoint_service.add_model_endpoint(llm_model_endpoint_streaming)
+    fake_llm_model_endpoint_service.add_model_endpoint(llm_model_endpoint_text_generation_inference)
+    use_case = BatchGetLLMModelEndpointsV1UseCase(
+        llm_model_endpoint_service=fake_llm_model_endpoint_service
+    )
+    user = User(user_id=test_api_key, team_id=test_api_key, is_privileged_user=True)
+    names = [
+        llm_model_endpoint_text_generation_inference.record.name,
+        llm_model_endpoint_async[0].record.name,
+        llm_model_endpoint_streaming.record.name,
+        llm_model_endpoint_async[0].record.name,
+    ]
+    response = await use_case.execute(
+        user=user, request=BatchGetLLMModelEndpointsV1Request(names=names)
+    )
+    assert [model_endpoint.name for model_endpoint in response.model_endpoints] == names
+
+    request = BatchGetLLMModelEndpointsV1Request(
+        names=[
+            llm_model_endpoint_text_generation_inference.record.name,
+            "invalid_model_endpoint_name",
+            llm_model_endpoint_streaming.record.name,
+        ]
+    )
+    with pytest.raises(ObjectNotFoundException):
+        await use_case.execute(user=user, request=request)
+
+
 @pytest.mark.asyncio
 async def test_completion_sync_use_case_success(
     test_api_key: str,
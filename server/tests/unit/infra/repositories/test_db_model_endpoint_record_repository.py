@@ -4,7 +4,10 @@ from unittest.mock import AsyncMock, Mock
 
 import pytest
 from llm_engine_server.common.dtos.model_endpoints import ModelEndpointOrderBy
-from llm_engine_server.core.domain_exceptions import ReadOnlyDatabaseException
+from llm_engine_server.core.domain_exceptions import (
+    ObjectAlreadyExistsException,
+    ReadOnlyDatabaseException,
+)
 from llm_engine_server.db.models import Bundle, Endpoint
 from llm_engine_server.domain.entities import ModelEndpointRecord
 from llm_engine_server.infra.gateways import FakeMonitoringMetricsGateway
@@ -24,11 +27,12 @@ async def test_create_model_endpoint_record(
     dbsession: Callable[[], AsyncSession],
     fake_monitoring_metrics_gateway: FakeMonitoringMetricsGateway,
 ):
-    def mock_model_endpoint_create(session: AsyncSession, endpoint: Endpoint) -> None:
+    def mock_model_endpoint_create(session: AsyncSession, endpoint: Endpoint) -> Optional[str]:
         endpoint.id = "test_model_endpoint_id"
         endpoint.created_at = datetime.datetime(2022, 1, 3)
         endpoint.last_updated_at = datetime.datetime(2022, 1, 3)
         endpoint.current_bundle = orm_model_bundle
+        return endpoint.id
 
     def mock_model_endpoint_select_by_id(
         session: AsyncSession, endpoint_id: str
@@ -39,7 +43,7 @@ async def test_create_model_endpoint_record(
         orm_model_endpoint.current_bundle = orm_model_bundle
         return orm_model_endpoint
 
-    OrmModelEndpoint.create = AsyncMock(side_effect=mock_model_endpoint_create)
+    OrmModelEndpoint.create_if_not_exists = AsyncMock(side_effect=mock_model_endpoint_create)
     OrmModelEndpoint.select_by_id = AsyncMock(side_effect=mock_model_endpoint_select_by_id)
 
     repo = DbModelEndpointRecordRepository(
@@ -62,19 +66,46 @@ async def test_create_model_endpoint_record(
     assert model_endpoint
 
 
+@pytest.mark.asyncio
+async def test_create_model_endpoint_record_raises_already_exists(
+    dbsession: Callable[[], AsyncSession],
+    fake_monitoring_metrics_gateway: FakeMonitoringMetricsGateway,
+):
+    OrmModelEndpoint.create_if_not_exists = AsyncMock(return_value=None)
+
+    repo = DbModelEndpointRecordRepository(
+        monitoring_metrics_gateway=fake_monitoring_metrics_gateway,
+        session=dbsession,
+        read_only=False,
+    )
+    with pytest.raises(ObjectAlreadyExistsException):
+        await repo.create_model_endpoint_record(
+            name="test_model_endpoint_name",
+            created_by="test_user_id",
+            model_bundle_id="test_model_bundle_id",
+            metadata={},
+            endpoint_type="async",
+            destination="test_destination",
+            creation_task_id="test_creation_task_id",
+            status="READY",
+            owner="test_user_id",
+        )
+
+
 @pytest.mark.asyncio
 async def test_create_model_endpoint_record_raises_if_read_only(
     orm_model_bundle: Bundle,
     dbsession: Callable[[], AsyncSession],
     fake_monitoring_metrics_gateway: FakeMonitoringMetricsGateway,
 ):
-    def mock_model_endpoint_create(session: AsyncSession, endpoint: Endpoint) -> None:
+    def mock_model_endpoint_create(session: AsyncSession, endpoint: Endpoint) -> Optional[str]:
         endpoint.id = "test_model_endpoint_id"
         endpoint.created_at = datetime.datetime(2022, 1, 3)
         endpoint.last_updated_at = datetime.datetime(2022, 1, 3)
         endpoint.current_bundle = orm_model_bundle
+        return endpoint.id
 
-    OrmModelEndpoint.create = AsyncMock(side_effect=mock_model_endpoint_create)
+    OrmModelEndpoint.create_if_not_exists = AsyncMock(side_effect=mock_model_endpoint_create)
 
     repo = DbModelEndpointRecordRepository(
         monitoring_metrics_gateway=fake_monitoring_metrics_gateway,
@@ -140,7 +171,7 @@ async def test_list_llm_model_endpoint_records(
     orm_model_bundle: Bundle,
     fake_monitoring_metrics_gateway: FakeMonitoringMetricsGateway,
 ):
-    filter_content = "endpoint_metadata ? '_llm' AND llm_engine.endpoints.name = :name_1 AND (llm_engine.endpoints.owner = :owner_1 OR llm_engine.endpoints.public_inference = true)"
+    filter_content = "llm_engine.endpoints.is_llm = true AND llm_engine.endpoints.name = :name_1 AND (llm_engine.endpoints.owner = :owner_1 OR llm_engine.endpoints.public_inference = true)"
 
     def mock_llm_model_endpoint_select_all_by_filters(
         session: AsyncSession, filters: Any
@@ -169,7 +200,7 @@ async def test_list_llm_model_endpoint_records(
         order_by=ModelEndpointOrderBy.NEWEST,
     )
 
-    filter_content = "endpoint_metadata ? '_llm' AND (llm_engine.endpoints.owner = :owner_1 OR llm_engine.endpoints.public_inference = true)"
+    filter_content = "llm_engine.endpoints.is_llm = true AND (llm_engine.endpoints.owner = :owner_1 OR llm_engine.endpoints.public_inference = true)"
     await repo.list_llm_model_endpoint_records(
         owner="test_user_id",
         name=None,
@@ -377,11 +408,12 @@ async def test_update_model_endpoint_record_raises_if_read_only(
 
     def mock_model_endpoint_update_by_name_owner(
         session: AsyncSession, name: str, owner: str, kwargs: Dict[str, Any]
-    ) -> None:
+    ) -> Optional[Endpoint]:
         orm_model_endpoint.name = name
         orm_model_endpoint.owner = owner
         for key, value in kwargs.items():
             orm_model_endpoint.__setattr__(key, value)
+        return orm_model_endpoint
 
     OrmModelEndpoint.select_by_id = AsyncMock(side_effect=mock_model_endpoint_select_by_id)
     OrmModelEndpoint.update_by_name_owner = AsyncMock(
@@ -425,11 +457,12 @@ async def test_update_model_endpoint_record_success(
 
     def mock_model_endpoint_update_by_name_owner(
         session: AsyncSession, name: str, owner: str, kwargs: Dict[str, Any]
-    ) -> None:
+    ) -> Optional[Endpoint]:
         orm_model_endpoint.name = name
         orm_model_endpoint.owner = owner
         for key, value in kwargs.items():
             orm_model_endpoint.__setattr__(key, value)
+        return orm_model_endpoint
 
     OrmModelEndpoint.select_by_id = AsyncMock(side_effect=mock_model_endpoint_select_by_id)
     OrmModelEndpoint.update_by_name_owner = AsyncMock(